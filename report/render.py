@@ -8,26 +8,267 @@ All business logic for status calculation, chart data generation, etc. is here.
 Usage:
     python3 render.py [--metrics PATH] [--template PATH] [--output PATH]
     
-    --metrics   Path to metrics JSON file (default: scripts/metrics/latest.json)
+    --metrics   Path to metrics JSON file, or a .msgpack copy of it
+                (default: scripts/metrics/latest.json)
     --template  Path to HTML template (default: report/template.html)
     --output    Path to output HTML file (default: output/index.html)
 """
 
 import json
 import os
+import string
 import sys
 import argparse
+from collections import Counter
 from datetime import datetime
+from functools import cache, lru_cache, partial
+from itertools import compress
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from typing import Callable, Dict, Any, List, Optional, Tuple
 
 try:
-    import yaml
-    HAS_YAML = True
+    import orjson
+    HAS_ORJSON = True
 except ImportError:
-    HAS_YAML = False
+    HAS_ORJSON = False
+
+try:
+    import msgpack
+    HAS_MSGPACK = True
+except ImportError:
+    HAS_MSGPACK = False
+
+
+class BraceTemplate(string.Template):
+    """string.Template for the report's {{TOKEN_NAME}} placeholders.
+
+    The placeholder regex is compiled once for the class and is what
+    parse_template() splits page templates with. Tokens are brace-delimited,
+    so one can never match inside another and no substitution order is
+    needed; safe_substitute() leaves tokens without a replacement in place.
+    """
+    delimiter = '{{'
+    flags = 0
+    # Only the named form exists; the other groups string.Template expects never match
+    pattern = r'\{\{(?:(?P<named>[A-Z0-9_]+)\}\}|(?P<escaped>(?!))|(?P<braced>(?!))|(?P<invalid>(?!)))'
+
+
+def parse_template(path: str) -> Tuple[Tuple[bytes, Optional[str]], ...]:
+    """Split a {{TOKEN}} template file into (literal, token name) segments.
+
+    Literals are pre-encoded UTF-8; the final segment has no token (None).
+    """
+    text = Path(path).read_text(encoding='utf-8')
+    segments = []
+    pos = 0
+    for m in BraceTemplate.pattern.finditer(text):
+        segments.append((text[pos:m.start()].encode('utf-8'), m.group('named')))
+        pos = m.end()
+    segments.append((text[pos:].encode('utf-8'), None))
+    return tuple(segments)
+
+
+def write_template(output_path: Path, segments: Tuple[Tuple[bytes, Optional[str]], ...],
+                   replacements: Dict[str, Any]) -> None:
+    """Stream parse_template() segments to output_path, filling in each token.
+
+    Chunks go straight into a 1 MiB write buffer, so the rendered page is
+    never assembled in memory. Unknown tokens are written back unchanged.
+    """
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(output_path, 'wb', buffering=1 << 20) as f:
+        write = f.write
+        for literal, name in segments:
+            write(literal)
+            if name is None:
+                continue
+            if name in replacements:
+                write(str(replacements[name]).encode('utf-8'))
+            else:
+                write(f'{{{{{name}}}}}'.encode('utf-8'))
+
+
+# Per-model card sections in report order:
+# (category, heading color, heading, heading margin-top, card border color)
+CATEGORY_SECTIONS = (
+    ('nlp', '#667eea', 'NLP Models', '0', None),
+    ('vision', '#17998e', 'Vision Models', '20px', '#17998e'),
+    ('multimodal', '#764ba2', 'Multimodal Models', '20px', '#764ba2'),
+    ('llm', '#f59e0b', 'LLM Models', '20px', '#f59e0b'),
+)
+
+# Chart palettes
+INSTALL_CHART_COLORS = ('#667eea', '#764ba2', '#38ef7d', '#11998e')
+BREAKDOWN_CHART_COLORS = ('#667eea', '#764ba2', '#38ef7d', '#f093fb', '#11998e')
+DEFAULT_CHART_COLOR = '#888888'
+MODEL_CHART_COLORS = {
+    # NLP models
+    'gpt2': '#667eea',
+    'bert': '#764ba2',
+    'roberta': '#f093fb',
+    't5': '#f59e0b',  # Orange for T5 (encoder-decoder)
+    'distilbert': '#a855f7',  # Purple
+    'albert': '#6366f1',  # Indigo
+    'sentence-transformers': '#3b82f6',  # Blue
+    # Vision models
+    'resnet': '#11998e',
+    'vgg': '#38ef7d',
+    'vit': '#10b981',
+    'convnext': '#06b6d4',
+    'mobilenet': '#ec4899',
+    'deit': '#14b8a6',
+    'efficientnet': '#84cc16',
+    'swin': '#22c55e',
+    'detr': '#eab308',
+    'segformer': '#f97316',
+    # Multimodal models
+    'clip': '#8b5cf6',  # Purple for CLIP (multi-encoder)
+    'wav2vec2': '#d946ef',
+    # LLM models (GGUF)
+    'tinyllama': '#f59e0b',  # Amber
+    'phi2': '#f97316',  # Orange
+    'qwen2-0.5b': '#fb923c',  # Light orange
+    'llama-3.2-1b': '#ef4444',  # Red
+    'llama-3.2-3b': '#dc2626',  # Dark red
+    'deepseek-coder-1.3b': '#0ea5e9',  # Sky blue
+    'deepseek-llm-7b': '#0284c7',  # Blue
+}
+
+# Per-model card shared by the inference metrics and model details sections
+_METRIC_CARD_TEMPLATE = '''
+                    <div class="metric-card"{card_style}>
+                        <div style="display: flex; justify-content: space-between; align-items: center; margin-bottom: 1rem;">
+                            <h4 style="margin: 0;">{display_name}</h4>
+                            <span class="status-badge {status_class}">{status}</span>
+                        </div>
+                        <div style="display: grid; grid-template-columns: 1fr 1fr; gap: 1rem;">
+                            <div>
+                                <div style="font-size: 0.75rem; color: var(--text-muted); margin-bottom: 0.25rem;">{left_label}</div>
+                                <div class="metric-value" style="font-size: 1.1rem;">{left_value}</div>
+                            </div>
+                            <div>
+                                <div style="font-size: 0.75rem; color: var(--text-muted); margin-bottom: 0.25rem;">{right_label}</div>
+                                <div class="metric-value" style="font-size: 1.1rem;">{right_value}</div>
+                            </div>
+                        </div>
+                    </div>
+                '''
+
+# Models page card and its per-input-type specification tables
+_MODEL_CARD_TEMPLATE = '''
+            <div class="model-card {enabled_class}">
+                <div class="model-header">
+                    <h3 class="model-name">{display_name}</h3>
+                    <span class="model-status {status_class}">{status_text}</span>
+                </div>
+                <p class="model-description">{description}</p>
+                <div class="model-axon-id">{axon_id}</div>
+                <div class="model-meta">
+                    <div class="meta-item">
+                        <div class="meta-label">Category</div>
+                        <div class="meta-value">{category}</div>
+                    </div>
+                    <div class="meta-item">
+                        <div class="meta-label">Input Type</div>
+                        <div class="meta-value">{input_type}</div>
+                    </div>
+                </div>
+                <div class="input-specs">
+                    <h4>Input Specifications</h4>
+                    {input_specs_html}
+                </div>
+                {notes_html}
+            </div>
+        '''
 
+_TEXT_SPECS_TEMPLATE = '''
+                <table class="input-table">
+                    <tr><td>Small Test</td><td>{small_tokens} tokens</td></tr>
+                    <tr><td>Large Test</td><td>{large_tokens} tokens</td></tr>
+                </table>
+            '''
 
+_IMAGE_SPECS_TEMPLATE = '''
+                <table class="input-table">
+                    <tr><td>Small Test</td><td>{small_w}x{small_h}x{channels}</td></tr>
+                    <tr><td>Large Test</td><td>{large_w}x{large_h}x{channels}</td></tr>
+                </table>
+            '''
+
+_TEXT_GENERATION_SPECS_TEMPLATE = '''
+                <table class="input-table">
+                    <tr><td>Format</td><td>{format_type}</td></tr>
+                    <tr><td>Small Test</td><td>{small_tokens} tokens</td></tr>
+                    <tr><td>Large Test</td><td>{large_tokens} tokens</td></tr>
+                </table>
+            '''
+
+_MULTIMODAL_SPECS_HTML = '<p style="font-size: 0.8rem; color: var(--text-muted);">Text + Image input</p>'
+
+# Models with a dedicated status badge in the report's Model Support section
+SUPPORT_MATRIX_MODELS = (
+    # NLP Models
+    'gpt2', 'bert', 'roberta', 't5',
+    # Vision Models
+    'resnet', 'vit', 'convnext', 'mobilenet', 'deit', 'efficientnet',
+    # Multimodal Models
+    'clip', 'wav2vec2',
+)
+
+
+@cache
+def pretty_model_name(name: str) -> str:
+    """Display name for a models.yaml key, e.g. 'sentence_transformers' -> 'Sentence Transformers'."""
+    return name.replace('_', ' ').title()
+
+
+@cache
+def yaml_parser() -> Callable[[Any], Any]:
+    """Import PyYAML on first use and return its fastest safe load function.
+
+    Uses libyaml's CSafeLoader when PyYAML was built with it, otherwise the
+    pure-Python SafeLoader. The choice is made once per process. Raises
+    ImportError if PyYAML is not installed.
+    """
+    import yaml
+    return partial(yaml.load, Loader=getattr(yaml, 'CSafeLoader', yaml.SafeLoader))
+
+
+def load_yaml_file(path: Path) -> Any:
+    """Parse a YAML file with yaml_parser().
+
+    Raises ImportError if PyYAML is not installed.
+    """
+    parse = yaml_parser()
+    with open(path, 'r', encoding='utf-8') as f:
+        return parse(f)
+
+
+def load_json_file(path: Path) -> Any:
+    """Parse a JSON file, using orjson when it is installed.
+
+    orjson decodes straight from bytes, skipping the text-mode UTF-8 decode
+    that json.load goes through. orjson.JSONDecodeError subclasses
+    json.JSONDecodeError, so callers only need to catch the latter.
+    """
+    if HAS_ORJSON:
+        return orjson.loads(path.read_bytes())
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def to_json(value: Any) -> str:
+    """Encode a value as compact JSON for embedding in the report's chart scripts.
+
+    The stdlib fallback uses the same separators and non-ASCII handling as
+    orjson, so both backends produce equivalent chart data.
+    """
+    if HAS_ORJSON:
+        return orjson.dumps(value).decode('utf-8')
+    return json.dumps(value, separators=(',', ':'), ensure_ascii=False)
+
+
+@lru_cache(maxsize=1024, typed=True)
 def format_time(ms: int) -> str:
     """Format milliseconds to human-readable time.
     
@@ -35,6 +276,9 @@ def format_time(ms: int) -> str:
     - 1-60s: show as seconds (e.g., "5.2s")
     - 1-60min: show as minutes (e.g., "3.5 min")
     - > 60min: show as hours (e.g., "1.2 hr")
+
+    Results are memoized; typed=True keeps 5 and 5.0 apart since they
+    format differently.
     """
     if ms < 1000:
         return f"{ms} ms"
@@ -54,6 +298,12 @@ def format_time(ms: int) -> str:
 class ReportRenderer:
     """Renders E2E test report from metrics JSON."""
 
+    __slots__ = (
+        'metrics_path', 'template_path', 'output_path', 'statistics_path', 'history_path',
+        'metrics', 'statistics', 'history',
+        '_by_category', '_status_cache', '_columns', '_totals', '_segments',
+    )
+
     def __init__(self, metrics_path: str, template_path: str, output_path: str,
                  statistics_path: str = None, history_path: str = None):
         self.metrics_path = Path(metrics_path)
@@ -64,21 +314,37 @@ class ReportRenderer:
         self.metrics: Dict[str, Any] = {}
         self.statistics: Dict[str, Any] = {}
         self.history: Dict[str, Any] = {}
+        # Derived from a single pass over metrics['models'] (see _precompute)
+        self._by_category: Dict[str, List[tuple]] = {}
+        self._status_cache: Dict[tuple, Dict[str, str]] = {}
+        self._columns: Dict[str, tuple] = {}
+        self._totals: Dict[str, Any] = {}
+        self._segments: Optional[Tuple[Tuple[bytes, Optional[str]], ...]] = None
+        self._precompute()
         
     def load_metrics(self) -> bool:
-        """Load metrics from JSON file."""
+        """Load metrics from JSON file (or its .msgpack binary copy)."""
         if not self.metrics_path.exists():
             print(f"❌ Metrics file not found: {self.metrics_path}")
             return False
         
         try:
-            with open(self.metrics_path, 'r', encoding='utf-8') as f:
-                self.metrics = json.load(f)
+            if self.metrics_path.suffix == '.msgpack':
+                if not HAS_MSGPACK:
+                    print(f"❌ msgpack not installed, cannot read {self.metrics_path}")
+                    return False
+                self.metrics = msgpack.unpackb(self.metrics_path.read_bytes())
+            else:
+                self.metrics = load_json_file(self.metrics_path)
+            self._precompute()
             print(f"✅ Loaded metrics from {self.metrics_path}")
             return True
         except json.JSONDecodeError as e:
             print(f"❌ Invalid JSON in metrics file: {e}")
             return False
+        except ValueError as e:  # msgpack's unpack errors are ValueErrors
+            print(f"❌ Invalid msgpack in metrics file: {e}")
+            return False
 
     def load_statistics(self) -> bool:
         """Load statistics from JSON file (optional)."""
@@ -87,8 +353,7 @@ class ReportRenderer:
             return False
 
         try:
-            with open(self.statistics_path, 'r', encoding='utf-8') as f:
-                self.statistics = json.load(f)
+            self.statistics = load_json_file(self.statistics_path)
             print(f"✅ Loaded statistics from {self.statistics_path}")
             return True
         except json.JSONDecodeError as e:
@@ -101,8 +366,7 @@ class ReportRenderer:
             return False
 
         try:
-            with open(self.history_path, 'r', encoding='utf-8') as f:
-                self.history = json.load(f)
+            self.history = load_json_file(self.history_path)
             print(f"✅ Loaded history from {self.history_path}")
             return True
         except json.JSONDecodeError as e:
@@ -118,23 +382,67 @@ class ReportRenderer:
         with open(self.template_path, 'r', encoding='utf-8') as f:
             return f.read()
     
+    def _precompute(self) -> None:
+        """Walk metrics['models'] once and cache what the report sections need.
+
+        Fills per-category model buckets and per-model status badges, and
+        transposes the per-model flags into columns (one tuple per field) so
+        the test totals are plain sum() reductions rather than dict.get chains.
+        """
+        by_category = {section[0]: [] for section in CATEGORY_SECTIONS}
+        status_cache = {}
+        status_badge = self._status_badge
+        categories = []
+        tested = []
+        small_ok = []
+        large_ok = []
+        large_counted = []
+
+        for model_name, model_data in self.metrics.get('models', {}).items():
+            get = model_data.get
+            small = status_badge(model_data, 'small')
+            status_cache[(model_name, 'small')] = small
+            status_cache[(model_name, 'large')] = status_badge(model_data, 'large')
+
+            # Flags combine with & and | so every model takes the same path.
+            # Large inference only counts for models that were tested at all;
+            # a large success counts even if inference_large_tested is unset.
+            is_tested = bool(get('tested', False))
+            is_large_ok = get('inference_large_status') == 'success'
+            categories.append(get('category'))
+            tested.append(is_tested)
+            small_ok.append(small['status_class'] == 'success')
+            large_ok.append(is_tested & is_large_ok)
+            large_counted.append(is_tested & (is_large_ok | bool(get('inference_large_tested', False))))
+
+            cat = get('category', 'nlp')
+            if cat in by_category:
+                by_category[cat].append((model_name, model_data))
+
+        self._by_category = by_category
+        self._status_cache = status_cache
+        self._columns = {
+            'category': tuple(categories),
+            'tested': tuple(tested),
+            'small_ok': tuple(small_ok),
+            'large_ok': tuple(large_ok),
+            'large_counted': tuple(large_counted),
+        }
+
+        # All reductions run in C: sum() over the flag columns and Counter
+        # over the categories selected by a flag column
+        self._totals = {
+            'total_tests': sum(tested) + sum(large_counted),
+            'passed_tests': sum(small_ok) + sum(large_ok),
+            'models_tested': sum(tested),
+            'category_tested': Counter(compress(categories, tested)),
+            'category_passed': Counter(compress(categories, small_ok)),
+        }
+
     def calculate_overall_status(self) -> Dict[str, Any]:
         """Calculate overall test status from metrics."""
-        models = self.metrics.get('models', {})
-        total_tests = 0
-        passed_tests = 0
-        
-        for model_name, model_data in models.items():
-            if model_data.get('tested', False):
-                total_tests += 1
-                if model_data.get('inference_status') == 'success':
-                    passed_tests += 1
-                # Count large inference separately if tested
-                if model_data.get('inference_large_status') == 'success':
-                    total_tests += 1
-                    passed_tests += 1
-                elif model_data.get('inference_large_tested', False):
-                    total_tests += 1
+        total_tests = self._totals['total_tests']
+        passed_tests = self._totals['passed_tests']
         
         success_rate = (passed_tests / total_tests * 100) if total_tests > 0 else 0
         
@@ -147,15 +455,8 @@ class ReportRenderer:
     
     def calculate_category_status(self, category: str) -> Dict[str, Any]:
         """Calculate status for a model category (nlp, vision, multimodal)."""
-        models = self.metrics.get('models', {})
-        tested = 0
-        passed = 0
-        
-        for model_name, model_data in models.items():
-            if model_data.get('category') == category and model_data.get('tested', False):
-                tested += 1
-                if model_data.get('inference_status') == 'success':
-                    passed += 1
+        tested = self._totals['category_tested'][category]
+        passed = self._totals['category_passed'][category]
         
         if tested == 0:
             return {
@@ -179,11 +480,9 @@ class ReportRenderer:
                 'passed': passed
             }
     
-    def get_model_status(self, model_name: str, test_type: str = 'small') -> Dict[str, str]:
-        """Get status badge info for a specific model."""
-        models = self.metrics.get('models', {})
-        model_data = models.get(model_name, {})
-        
+    @staticmethod
+    def _status_badge(model_data: Dict[str, Any], test_type: str) -> Dict[str, str]:
+        """Build the status badge info for one model's metrics entry."""
         if test_type == 'large':
             status_key = 'inference_large_status'
             tested_key = 'inference_large_tested'
@@ -197,6 +496,14 @@ class ReportRenderer:
             return {'status': '✅', 'status_class': 'success'}
         else:
             return {'status': '❌', 'status_class': 'failed'}
+
+    def get_model_status(self, model_name: str, test_type: str = 'small') -> Dict[str, str]:
+        """Get status badge info for a specific model."""
+        cached = self._status_cache.get((model_name, test_type))
+        if cached is not None:
+            return cached
+        model_data = self.metrics.get('models', {}).get(model_name, {})
+        return self._status_badge(model_data, test_type)
     
     def generate_installation_chart_data(self) -> Dict[str, Any]:
         """Generate data for installation times chart."""
@@ -209,12 +516,12 @@ class ReportRenderer:
             timings.get('core_startup_ms', 0),
             timings.get('total_model_install_ms', 0)
         ]
-        colors = ['#667eea', '#764ba2', '#38ef7d', '#11998e']
+        colors = INSTALL_CHART_COLORS
         
         return {
-            'labels': json.dumps(labels),
-            'data': json.dumps(data),
-            'colors': json.dumps(colors)
+            'labels': to_json(labels),
+            'data': to_json(data),
+            'colors': to_json(colors)
         }
     
     def generate_inference_chart_data(self) -> Dict[str, Any]:
@@ -225,57 +532,24 @@ class ReportRenderer:
         data = []
         colors = []
         
-        color_map = {
-            # NLP models
-            'gpt2': '#667eea',
-            'bert': '#764ba2',
-            'roberta': '#f093fb',
-            't5': '#f59e0b',  # Orange for T5 (encoder-decoder)
-            'distilbert': '#a855f7',  # Purple
-            'albert': '#6366f1',  # Indigo
-            'sentence-transformers': '#3b82f6',  # Blue
-            # Vision models
-            'resnet': '#11998e',
-            'vgg': '#38ef7d',
-            'vit': '#10b981',
-            'convnext': '#06b6d4',
-            'mobilenet': '#ec4899',
-            'deit': '#14b8a6',
-            'efficientnet': '#84cc16',
-            'swin': '#22c55e',
-            'detr': '#eab308',
-            'segformer': '#f97316',
-            # Multimodal models
-            'clip': '#8b5cf6',  # Purple for CLIP (multi-encoder)
-            'wav2vec2': '#d946ef',
-            # LLM models (GGUF)
-            'tinyllama': '#f59e0b',  # Amber
-            'phi2': '#f97316',  # Orange
-            'qwen2-0.5b': '#fb923c',  # Light orange
-            'llama-3.2-1b': '#ef4444',  # Red
-            'llama-3.2-3b': '#dc2626',  # Dark red
-            'deepseek-coder-1.3b': '#0ea5e9',  # Sky blue
-            'deepseek-llm-7b': '#0284c7',  # Blue
-        }
-        
         for model_name, model_data in models.items():
             if model_data.get('tested', False):
                 # Small inference
                 if model_data.get('inference_time_ms', 0) > 0:
                     labels.append(f"{model_name.upper()} (small)")
                     data.append(model_data['inference_time_ms'])
-                    colors.append(color_map.get(model_name, '#888888'))
+                    colors.append(MODEL_CHART_COLORS.get(model_name, DEFAULT_CHART_COLOR))
                 
                 # Large inference
                 if model_data.get('inference_large_time_ms', 0) > 0:
                     labels.append(f"{model_name.upper()} (large)")
                     data.append(model_data['inference_large_time_ms'])
-                    colors.append(color_map.get(model_name, '#888888'))
+                    colors.append(MODEL_CHART_COLORS.get(model_name, DEFAULT_CHART_COLOR))
         
         return {
-            'labels': json.dumps(labels),
-            'data': json.dumps(data),
-            'colors': json.dumps(colors)
+            'labels': to_json(labels),
+            'data': to_json(data),
+            'colors': to_json(colors)
         }
     
     def generate_breakdown_chart_data(self) -> Dict[str, Any]:
@@ -291,290 +565,90 @@ class ReportRenderer:
             timings.get('total_register_ms', 0),
             timings.get('total_inference_ms', 0)
         ]
-        colors = ['#667eea', '#764ba2', '#38ef7d', '#f093fb', '#11998e']
+        colors = BREAKDOWN_CHART_COLORS
         
         return {
-            'labels': json.dumps(labels),
-            'data': json.dumps(data),
-            'colors': json.dumps(colors),
+            'labels': to_json(labels),
+            'data': to_json(data),
+            'colors': to_json(colors),
             'model_install_ms': timings.get('total_model_install_ms', 0)
         }
     
-    def generate_inference_metrics_html(self) -> str:
-        """Generate HTML for inference metrics cards - one card per model with both small/large inside."""
-        models = self.metrics.get('models', {})
-        html_parts = []
-        
-        # Group by category for better organization
-        categories = {'nlp': [], 'vision': [], 'multimodal': [], 'llm': []}
-        for model_name, model_data in models.items():
-            if not model_data.get('tested', False):
+    def _render_metric_card(self, model_name: str, border_color: Optional[str],
+                            left_label: str, left_value: str,
+                            right_label: str, right_value: str) -> str:
+        """Render one per-model metric card with a status badge and two values."""
+        overall_status = self.get_model_status(model_name)
+        return _METRIC_CARD_TEMPLATE.format_map({
+            'card_style': f' style="border-left-color: {border_color};"' if border_color else '',
+            'display_name': model_name.upper(),
+            'status_class': overall_status['status_class'],
+            'status': overall_status['status'],
+            'left_label': left_label,
+            'left_value': left_value,
+            'right_label': right_label,
+            'right_value': right_value,
+        })
+
+    def generate_model_sections_html(self) -> Tuple[str, str]:
+        """Generate the inference metrics and model details card sections together.
+
+        Both sections list models by category with one card each, so they are
+        built in a single walk over the category buckets. Returns
+        (inference_metrics_html, model_details_html).
+        """
+        inference_parts = []
+        details_parts = []
+        inference_append = inference_parts.append
+        details_append = details_parts.append
+        render_card = self._render_metric_card
+        ft = format_time
+        by_category = self._by_category
+
+        for cat, heading_color, title, margin_top, border_color in CATEGORY_SECTIONS:
+            cat_models = by_category.get(cat)
+            if not cat_models:
                 continue
-            cat = model_data.get('category', 'nlp')
-            if cat in categories:
-                categories[cat].append((model_name, model_data))
-        
-        # NLP Models
-        if categories['nlp']:
-            html_parts.append('<div class="category-section"><h4 style="color: #667eea; margin-bottom: 8px; margin-top: 0;">NLP Models</h4>')
-            html_parts.append('<div class="metrics-grid">')
-            for model_name, model_data in categories['nlp']:
-                display_name = model_name.upper()
-                time_small = model_data.get('inference_time_ms', 0)
-                time_large = model_data.get('inference_large_time_ms', 0)
-                overall_status = self.get_model_status(model_name)
-                
-                html_parts.append(f'''
-                    <div class="metric-card">
-                        <div style="display: flex; justify-content: space-between; align-items: center; margin-bottom: 1rem;">
-                            <h4 style="margin: 0;">{display_name}</h4>
-                            <span class="status-badge {overall_status['status_class']}">{overall_status['status']}</span>
-                        </div>
-                        <div style="display: grid; grid-template-columns: 1fr 1fr; gap: 1rem;">
-                            <div>
-                                <div style="font-size: 0.75rem; color: var(--text-muted); margin-bottom: 0.25rem;">Small Inference</div>
-                                <div class="metric-value" style="font-size: 1.1rem;">{format_time(time_small)}</div>
-                            </div>
-                            <div>
-                                <div style="font-size: 0.75rem; color: var(--text-muted); margin-bottom: 0.25rem;">Large Inference</div>
-                                <div class="metric-value" style="font-size: 1.1rem;">{format_time(time_large) if time_large > 0 else 'N/A'}</div>
-                            </div>
-                        </div>
-                    </div>
-                ''')
-            html_parts.append('</div>')
-            html_parts.append('</div>')
-        # Vision Models
-        if categories['vision']:
-            html_parts.append('<div class="category-section"><h4 style="color: #17998e; margin-bottom: 8px; margin-top: 20px;">Vision Models</h4>')
-            html_parts.append('<div class="metrics-grid">')
-            for model_name, model_data in categories['vision']:
-                display_name = model_name.upper()
-                time_small = model_data.get('inference_time_ms', 0)
-                time_large = model_data.get('inference_large_time_ms', 0)
-                overall_status = self.get_model_status(model_name)
-                
-                html_parts.append(f'''
-                    <div class="metric-card" style="border-left-color: #17998e;">
-                        <div style="display: flex; justify-content: space-between; align-items: center; margin-bottom: 1rem;">
-                            <h4 style="margin: 0;">{display_name}</h4>
-                            <span class="status-badge {overall_status['status_class']}">{overall_status['status']}</span>
-                        </div>
-                        <div style="display: grid; grid-template-columns: 1fr 1fr; gap: 1rem;">
-                            <div>
-                                <div style="font-size: 0.75rem; color: var(--text-muted); margin-bottom: 0.25rem;">Small Inference</div>
-                                <div class="metric-value" style="font-size: 1.1rem;">{format_time(time_small)}</div>
-                            </div>
-                            <div>
-                                <div style="font-size: 0.75rem; color: var(--text-muted); margin-bottom: 0.25rem;">Large Inference</div>
-                                <div class="metric-value" style="font-size: 1.1rem;">{format_time(time_large) if time_large > 0 else 'N/A'}</div>
-                            </div>
-                        </div>
-                    </div>
-                ''')
-            html_parts.append('</div>')
-            html_parts.append('</div>')
-        
-        # Multimodal Models
-        if categories['multimodal']:
-            html_parts.append('<div class="category-section"><h4 style="color: #764ba2; margin-bottom: 8px; margin-top: 20px;">Multimodal Models</h4>')
-            html_parts.append('<div class="metrics-grid">')
-            for model_name, model_data in categories['multimodal']:
-                display_name = model_name.upper()
-                time_small = model_data.get('inference_time_ms', 0)
-                time_large = model_data.get('inference_large_time_ms', 0)
-                overall_status = self.get_model_status(model_name)
-                
-                html_parts.append(f'''
-                    <div class="metric-card" style="border-left-color: #764ba2;">
-                        <div style="display: flex; justify-content: space-between; align-items: center; margin-bottom: 1rem;">
-                            <h4 style="margin: 0;">{display_name}</h4>
-                            <span class="status-badge {overall_status['status_class']}">{overall_status['status']}</span>
-                        </div>
-                        <div style="display: grid; grid-template-columns: 1fr 1fr; gap: 1rem;">
-                            <div>
-                                <div style="font-size: 0.75rem; color: var(--text-muted); margin-bottom: 0.25rem;">Small Inference</div>
-                                <div class="metric-value" style="font-size: 1.1rem;">{format_time(time_small)}</div>
-                            </div>
-                            <div>
-                                <div style="font-size: 0.75rem; color: var(--text-muted); margin-bottom: 0.25rem;">Large Inference</div>
-                                <div class="metric-value" style="font-size: 1.1rem;">{format_time(time_large) if time_large > 0 else 'N/A'}</div>
-                            </div>
-                        </div>
-                    </div>
-                ''')
-            html_parts.append('</div>')
-            html_parts.append('</div>')
-
-        # LLM Models (GGUF)
-        if categories['llm']:
-            html_parts.append('<div class="category-section"><h4 style="color: #f59e0b; margin-bottom: 8px; margin-top: 20px;">LLM Models</h4>')
-            html_parts.append('<div class="metrics-grid">')
-            for model_name, model_data in categories['llm']:
-                display_name = model_name.upper()
-                time_small = model_data.get('inference_time_ms', 0)
-                time_large = model_data.get('inference_large_time_ms', 0)
-                overall_status = self.get_model_status(model_name)
-
-                html_parts.append(f'''
-                    <div class="metric-card" style="border-left-color: #f59e0b;">
-                        <div style="display: flex; justify-content: space-between; align-items: center; margin-bottom: 1rem;">
-                            <h4 style="margin: 0;">{display_name}</h4>
-                            <span class="status-badge {overall_status['status_class']}">{overall_status['status']}</span>
-                        </div>
-                        <div style="display: grid; grid-template-columns: 1fr 1fr; gap: 1rem;">
-                            <div>
-                                <div style="font-size: 0.75rem; color: var(--text-muted); margin-bottom: 0.25rem;">Small Inference</div>
-                                <div class="metric-value" style="font-size: 1.1rem;">{format_time(time_small)}</div>
-                            </div>
-                            <div>
-                                <div style="font-size: 0.75rem; color: var(--text-muted); margin-bottom: 0.25rem;">Large Inference</div>
-                                <div class="metric-value" style="font-size: 1.1rem;">{format_time(time_large) if time_large > 0 else 'N/A'}</div>
-                            </div>
-                        </div>
-                    </div>
-                ''')
-            html_parts.append('</div>')
-            html_parts.append('</div>')
+            heading = f'<div class="category-section"><h4 style="color: {heading_color}; margin-bottom: 8px; margin-top: {margin_top};">{title}</h4>'
+
+            # Every model gets a details card; only tested models get an inference card
+            inference_cards = []
+            details_append(heading)
+            details_append('<div class="metrics-grid">')
+            for model_name, model_data in cat_models:
+                get = model_data.get
+                details_append(render_card(
+                    model_name, border_color,
+                    'Install Time', ft(get('install_time_ms', 0)),
+                    'Register Time', ft(get('register_time_ms', 0)),
+                ))
+                if get('tested', False):
+                    time_small = get('inference_time_ms', 0)
+                    time_large = get('inference_large_time_ms', 0)
+                    inference_cards.append(render_card(
+                        model_name, border_color,
+                        'Small Inference', ft(time_small),
+                        'Large Inference', ft(time_large) if time_large > 0 else 'N/A',
+                    ))
+            details_append('</div>')
+            details_append('</div>')
 
-        return '\n'.join(html_parts)
+            if inference_cards:
+                inference_append(heading)
+                inference_append('<div class="metrics-grid">')
+                inference_parts.extend(inference_cards)
+                inference_append('</div>')
+                inference_append('</div>')
 
-    def generate_model_details_html(self) -> str:
-        """Generate HTML for model details section - one card per model with timing data points inside."""
-        models = self.metrics.get('models', {})
-        html_parts = []
+        return '\n'.join(inference_parts), '\n'.join(details_parts)
 
-        # Group by category
-        categories = {'nlp': [], 'vision': [], 'multimodal': [], 'llm': []}
-        for model_name, model_data in models.items():
-            cat = model_data.get('category', 'nlp')
-            if cat in categories:
-                categories[cat].append((model_name, model_data))
-        
-        # NLP Models
-        if categories['nlp']:
-            html_parts.append('<div class="category-section"><h4 style="color: #667eea; margin-bottom: 8px; margin-top: 0;">NLP Models</h4>')
-            html_parts.append('<div class="metrics-grid">')
-            for model_name, model_data in categories['nlp']:
-                display_name = model_name.upper()
-                install_time = model_data.get('install_time_ms', 0)
-                register_time = model_data.get('register_time_ms', 0)
-                overall_status = self.get_model_status(model_name)
-                
-                html_parts.append(f'''
-                    <div class="metric-card">
-                        <div style="display: flex; justify-content: space-between; align-items: center; margin-bottom: 1rem;">
-                            <h4 style="margin: 0;">{display_name}</h4>
-                            <span class="status-badge {overall_status['status_class']}">{overall_status['status']}</span>
-                        </div>
-                        <div style="display: grid; grid-template-columns: 1fr 1fr; gap: 1rem;">
-                            <div>
-                                <div style="font-size: 0.75rem; color: var(--text-muted); margin-bottom: 0.25rem;">Install Time</div>
-                                <div class="metric-value" style="font-size: 1.1rem;">{format_time(install_time)}</div>
-                            </div>
-                            <div>
-                                <div style="font-size: 0.75rem; color: var(--text-muted); margin-bottom: 0.25rem;">Register Time</div>
-                                <div class="metric-value" style="font-size: 1.1rem;">{format_time(register_time)}</div>
-                            </div>
-                        </div>
-                    </div>
-                ''')
-            html_parts.append('</div>')
-            html_parts.append('</div>')
-        # Vision Models
-        if categories['vision']:
-            html_parts.append('<div class="category-section"><h4 style="color: #17998e; margin-bottom: 8px; margin-top: 20px;">Vision Models</h4>')
-            html_parts.append('<div class="metrics-grid">')
-            for model_name, model_data in categories['vision']:
-                display_name = model_name.upper()
-                install_time = model_data.get('install_time_ms', 0)
-                register_time = model_data.get('register_time_ms', 0)
-                overall_status = self.get_model_status(model_name)
-                
-                html_parts.append(f'''
-                    <div class="metric-card" style="border-left-color: #17998e;">
-                        <div style="display: flex; justify-content: space-between; align-items: center; margin-bottom: 1rem;">
-                            <h4 style="margin: 0;">{display_name}</h4>
-                            <span class="status-badge {overall_status['status_class']}">{overall_status['status']}</span>
-                        </div>
-                        <div style="display: grid; grid-template-columns: 1fr 1fr; gap: 1rem;">
-                            <div>
-                                <div style="font-size: 0.75rem; color: var(--text-muted); margin-bottom: 0.25rem;">Install Time</div>
-                                <div class="metric-value" style="font-size: 1.1rem;">{format_time(install_time)}</div>
-                            </div>
-                            <div>
-                                <div style="font-size: 0.75rem; color: var(--text-muted); margin-bottom: 0.25rem;">Register Time</div>
-                                <div class="metric-value" style="font-size: 1.1rem;">{format_time(register_time)}</div>
-                            </div>
-                        </div>
-                    </div>
-                ''')
-            html_parts.append('</div>')
-            html_parts.append('</div>')
-        
-        # Multimodal Models
-        if categories['multimodal']:
-            html_parts.append('<div class="category-section"><h4 style="color: #764ba2; margin-bottom: 8px; margin-top: 20px;">Multimodal Models</h4>')
-            html_parts.append('<div class="metrics-grid">')
-            for model_name, model_data in categories['multimodal']:
-                display_name = model_name.upper()
-                install_time = model_data.get('install_time_ms', 0)
-                register_time = model_data.get('register_time_ms', 0)
-                overall_status = self.get_model_status(model_name)
-                
-                html_parts.append(f'''
-                    <div class="metric-card" style="border-left-color: #764ba2;">
-                        <div style="display: flex; justify-content: space-between; align-items: center; margin-bottom: 1rem;">
-                            <h4 style="margin: 0;">{display_name}</h4>
-                            <span class="status-badge {overall_status['status_class']}">{overall_status['status']}</span>
-                        </div>
-                        <div style="display: grid; grid-template-columns: 1fr 1fr; gap: 1rem;">
-                            <div>
-                                <div style="font-size: 0.75rem; color: var(--text-muted); margin-bottom: 0.25rem;">Install Time</div>
-                                <div class="metric-value" style="font-size: 1.1rem;">{format_time(install_time)}</div>
-                            </div>
-                            <div>
-                                <div style="font-size: 0.75rem; color: var(--text-muted); margin-bottom: 0.25rem;">Register Time</div>
-                                <div class="metric-value" style="font-size: 1.1rem;">{format_time(register_time)}</div>
-                            </div>
-                        </div>
-                    </div>
-                ''')
-            html_parts.append('</div>')
-            html_parts.append('</div>')
-
-        # LLM Models
-        if categories['llm']:
-            html_parts.append('<div class="category-section"><h4 style="color: #f59e0b; margin-bottom: 8px; margin-top: 20px;">LLM Models</h4>')
-            html_parts.append('<div class="metrics-grid">')
-            for model_name, model_data in categories['llm']:
-                display_name = model_name.upper()
-                install_time = model_data.get('install_time_ms', 0)
-                register_time = model_data.get('register_time_ms', 0)
-                overall_status = self.get_model_status(model_name)
-
-                html_parts.append(f'''
-                    <div class="metric-card" style="border-left-color: #f59e0b;">
-                        <div style="display: flex; justify-content: space-between; align-items: center; margin-bottom: 1rem;">
-                            <h4 style="margin: 0;">{display_name}</h4>
-                            <span class="status-badge {overall_status['status_class']}">{overall_status['status']}</span>
-                        </div>
-                        <div style="display: grid; grid-template-columns: 1fr 1fr; gap: 1rem;">
-                            <div>
-                                <div style="font-size: 0.75rem; color: var(--text-muted); margin-bottom: 0.25rem;">Install Time</div>
-                                <div class="metric-value" style="font-size: 1.1rem;">{format_time(install_time)}</div>
-                            </div>
-                            <div>
-                                <div style="font-size: 0.75rem; color: var(--text-muted); margin-bottom: 0.25rem;">Register Time</div>
-                                <div class="metric-value" style="font-size: 1.1rem;">{format_time(register_time)}</div>
-                            </div>
-                        </div>
-                    </div>
-                ''')
-            html_parts.append('</div>')
-            html_parts.append('</div>')
+    def generate_inference_metrics_html(self) -> str:
+        """Generate HTML for inference metrics cards - one card per model with both small/large inside."""
+        return self.generate_model_sections_html()[0]
 
-        return '\n'.join(html_parts)
+    def generate_model_details_html(self) -> str:
+        """Generate HTML for model details section - one card per model with timing data points inside."""
+        return self.generate_model_sections_html()[1]
 
     def _get_kernel_mode_display(self, kernel_mode: str) -> str:
         """Get human-readable kernel mode description."""
@@ -1057,119 +1131,97 @@ class ReportRenderer:
         install_chart = self.generate_installation_chart_data()
         inference_chart = self.generate_inference_chart_data()
         breakdown_chart = self.generate_breakdown_chart_data()
+        inference_metrics_html, model_details_html = self.generate_model_sections_html()
         
         versions = self.metrics.get('versions', {})
         hardware = self.metrics.get('hardware', {})
         timings = self.metrics.get('timings', {})
         resources = self.metrics.get('resources', {})
-        models = self.metrics.get('models', {})
         
         replacements = {
             # Overall status
-            '{{OVERALL_SUCCESS_RATE}}': str(overall['success_rate']),
-            '{{TOTAL_DURATION}}': str(timings.get('total_duration_s', 0)),
-            '{{TOTAL_INFERENCES}}': f"{overall['passed_tests']}/{overall['total_tests']}",
-            '{{MODELS_TESTED}}': str(len([m for m in models.values() if m.get('tested')])),
+            'OVERALL_SUCCESS_RATE': str(overall['success_rate']),
+            'TOTAL_DURATION': str(timings.get('total_duration_s', 0)),
+            'TOTAL_INFERENCES': f"{overall['passed_tests']}/{overall['total_tests']}",
+            'MODELS_TESTED': str(self._totals['models_tested']),
             
             # Versions
-            '{{AXON_VERSION}}': versions.get('axon', 'N/A'),
-            '{{CORE_VERSION}}': versions.get('core', 'N/A'),
+            'AXON_VERSION': versions.get('axon', 'N/A'),
+            'CORE_VERSION': versions.get('core', 'N/A'),
             
             # Hardware
-            '{{OS_NAME}}': hardware.get('os', 'Unknown'),
-            '{{OS_VERSION}}': hardware.get('os_version', ''),
-            '{{ARCH}}': hardware.get('arch', 'Unknown'),
-            '{{CPU_MODEL}}': hardware.get('cpu_model', 'Unknown'),
-            '{{CPU_CORES}}': str(hardware.get('cpu_cores', 0)),
-            '{{CPU_THREADS}}': str(hardware.get('cpu_threads', 0)),
-            '{{MEMORY_GB}}': str(hardware.get('memory_gb', 0)),
-            '{{GPU_NAME}}': hardware.get('gpu_name', 'None detected'),
-            '{{GPU_COUNT}}': str(hardware.get('gpu_count', 0)),
-            '{{GPU_MEMORY}}': hardware.get('gpu_memory', 'N/A'),
-            '{{DISK_TOTAL}}': hardware.get('disk_total', 'N/A'),
-            '{{DISK_AVAILABLE}}': hardware.get('disk_available', 'N/A'),
+            'OS_NAME': hardware.get('os', 'Unknown'),
+            'OS_VERSION': hardware.get('os_version', ''),
+            'ARCH': hardware.get('arch', 'Unknown'),
+            'CPU_MODEL': hardware.get('cpu_model', 'Unknown'),
+            'CPU_CORES': str(hardware.get('cpu_cores', 0)),
+            'CPU_THREADS': str(hardware.get('cpu_threads', 0)),
+            'MEMORY_GB': str(hardware.get('memory_gb', 0)),
+            'GPU_NAME': hardware.get('gpu_name', 'None detected'),
+            'GPU_COUNT': str(hardware.get('gpu_count', 0)),
+            'GPU_MEMORY': hardware.get('gpu_memory', 'N/A'),
+            'DISK_TOTAL': hardware.get('disk_total', 'N/A'),
+            'DISK_AVAILABLE': hardware.get('disk_available', 'N/A'),
             
             # Resource usage
-            '{{CORE_IDLE_CPU}}': str(resources.get('core_idle_cpu', 0)),
-            '{{CORE_IDLE_MEM}}': str(resources.get('core_idle_mem_mb', 0)),
-            '{{CORE_LOAD_CPU_AVG}}': str(resources.get('core_load_cpu_avg', 0)),
-            '{{CORE_LOAD_CPU_MAX}}': str(resources.get('core_load_cpu_max', 0)),
-            '{{CORE_LOAD_MEM_AVG}}': str(resources.get('core_load_mem_avg_mb', 0)),
-            '{{CORE_LOAD_MEM_MAX}}': str(resources.get('core_load_mem_max_mb', 0)),
-            '{{AXON_CPU}}': str(resources.get('axon_cpu', 0)),
-            '{{AXON_MEM}}': str(resources.get('axon_mem_mb', 0)),
-            '{{GPU_STATUS}}': resources.get('gpu_status', 'Not used (CPU-only inference)'),
-            '{{KERNEL_MODE}}': resources.get('kernel_mode', 'userspace'),
-            '{{KERNEL_MODE_DISPLAY}}': self._get_kernel_mode_display(resources.get('kernel_mode', 'userspace')),
-            '{{KERNEL_MODULE_LOADED}}': 'Yes' if resources.get('kernel_module_loaded', False) else 'No',
+            'CORE_IDLE_CPU': str(resources.get('core_idle_cpu', 0)),
+            'CORE_IDLE_MEM': str(resources.get('core_idle_mem_mb', 0)),
+            'CORE_LOAD_CPU_AVG': str(resources.get('core_load_cpu_avg', 0)),
+            'CORE_LOAD_CPU_MAX': str(resources.get('core_load_cpu_max', 0)),
+            'CORE_LOAD_MEM_AVG': str(resources.get('core_load_mem_avg_mb', 0)),
+            'CORE_LOAD_MEM_MAX': str(resources.get('core_load_mem_max_mb', 0)),
+            'AXON_CPU': str(resources.get('axon_cpu', 0)),
+            'AXON_MEM': str(resources.get('axon_mem_mb', 0)),
+            'GPU_STATUS': resources.get('gpu_status', 'Not used (CPU-only inference)'),
+            'KERNEL_MODE': resources.get('kernel_mode', 'userspace'),
+            'KERNEL_MODE_DISPLAY': self._get_kernel_mode_display(resources.get('kernel_mode', 'userspace')),
+            'KERNEL_MODULE_LOADED': 'Yes' if resources.get('kernel_module_loaded', False) else 'No',
             
             # Timings (formatted for display)
-            '{{AXON_DOWNLOAD_TIME}}': format_time(timings.get('axon_download_ms', 0)),
-            '{{CORE_DOWNLOAD_TIME}}': format_time(timings.get('core_download_ms', 0)),
-            '{{CORE_STARTUP_TIME}}': format_time(timings.get('core_startup_ms', 0)),
-            '{{TOTAL_MODEL_INSTALL_TIME}}': format_time(timings.get('total_model_install_ms', 0)),
+            'AXON_DOWNLOAD_TIME': format_time(timings.get('axon_download_ms', 0)),
+            'CORE_DOWNLOAD_TIME': format_time(timings.get('core_download_ms', 0)),
+            'CORE_STARTUP_TIME': format_time(timings.get('core_startup_ms', 0)),
+            'TOTAL_MODEL_INSTALL_TIME': format_time(timings.get('total_model_install_ms', 0)),
             
             # Category status
-            '{{NLP_STATUS}}': nlp_status['status'],
-            '{{NLP_STATUS_CLASS}}': nlp_status['status_class'],
-            '{{VISION_STATUS}}': vision_status['status'],
-            '{{VISION_STATUS_CLASS}}': vision_status['status_class'],
-            '{{MULTIMODAL_STATUS}}': multimodal_status['status'],
-            '{{MULTIMODAL_STATUS_CLASS}}': multimodal_status['status_class'],
-            '{{LLM_STATUS}}': llm_status['status'],
-            '{{LLM_STATUS_CLASS}}': llm_status['status_class'],
+            'NLP_STATUS': nlp_status['status'],
+            'NLP_STATUS_CLASS': nlp_status['status_class'],
+            'VISION_STATUS': vision_status['status'],
+            'VISION_STATUS_CLASS': vision_status['status_class'],
+            'MULTIMODAL_STATUS': multimodal_status['status'],
+            'MULTIMODAL_STATUS_CLASS': multimodal_status['status_class'],
+            'LLM_STATUS': llm_status['status'],
+            'LLM_STATUS_CLASS': llm_status['status_class'],
             
             # Chart data
-            '{{INSTALL_CHART_LABELS}}': install_chart['labels'],
-            '{{INSTALL_CHART_DATA}}': install_chart['data'],
-            '{{INSTALL_CHART_COLORS}}': install_chart['colors'],
-            '{{INFERENCE_CHART_LABELS}}': inference_chart['labels'],
-            '{{INFERENCE_CHART_DATA}}': inference_chart['data'],
-            '{{INFERENCE_CHART_COLORS}}': inference_chart['colors'],
-            '{{BREAKDOWN_CHART_LABELS}}': breakdown_chart['labels'],
-            '{{BREAKDOWN_CHART_DATA}}': breakdown_chart['data'],
-            '{{BREAKDOWN_CHART_COLORS}}': breakdown_chart['colors'],
-            '{{MODEL_INSTALL_TIME_CALLOUT}}': format_time(breakdown_chart['model_install_ms']),
+            'INSTALL_CHART_LABELS': install_chart['labels'],
+            'INSTALL_CHART_DATA': install_chart['data'],
+            'INSTALL_CHART_COLORS': install_chart['colors'],
+            'INFERENCE_CHART_LABELS': inference_chart['labels'],
+            'INFERENCE_CHART_DATA': inference_chart['data'],
+            'INFERENCE_CHART_COLORS': inference_chart['colors'],
+            'BREAKDOWN_CHART_LABELS': breakdown_chart['labels'],
+            'BREAKDOWN_CHART_DATA': breakdown_chart['data'],
+            'BREAKDOWN_CHART_COLORS': breakdown_chart['colors'],
+            'MODEL_INSTALL_TIME_CALLOUT': format_time(breakdown_chart['model_install_ms']),
             
             # Dynamic HTML sections
-            '{{INFERENCE_METRICS_HTML}}': self.generate_inference_metrics_html(),
-            '{{MODEL_DETAILS_HTML}}': self.generate_model_details_html(),
-            '{{KERNEL_SECTION_HTML}}': self.generate_kernel_section_html(),
-            
-            # Model-specific status (for Model Support section)
-            # NLP Models
-            '{{GPT2_STATUS}}': self.get_model_status('gpt2')['status'],
-            '{{GPT2_STATUS_CLASS}}': self.get_model_status('gpt2')['status_class'],
-            '{{BERT_STATUS}}': self.get_model_status('bert')['status'],
-            '{{BERT_STATUS_CLASS}}': self.get_model_status('bert')['status_class'],
-            '{{ROBERTA_STATUS}}': self.get_model_status('roberta')['status'],
-            '{{ROBERTA_STATUS_CLASS}}': self.get_model_status('roberta')['status_class'],
-            '{{T5_STATUS}}': self.get_model_status('t5')['status'],
-            '{{T5_STATUS_CLASS}}': self.get_model_status('t5')['status_class'],
-            # Vision Models
-            '{{RESNET_STATUS}}': self.get_model_status('resnet')['status'],
-            '{{RESNET_STATUS_CLASS}}': self.get_model_status('resnet')['status_class'],
-            '{{VIT_STATUS}}': self.get_model_status('vit')['status'],
-            '{{VIT_STATUS_CLASS}}': self.get_model_status('vit')['status_class'],
-            '{{CONVNEXT_STATUS}}': self.get_model_status('convnext')['status'],
-            '{{CONVNEXT_STATUS_CLASS}}': self.get_model_status('convnext')['status_class'],
-            '{{MOBILENET_STATUS}}': self.get_model_status('mobilenet')['status'],
-            '{{MOBILENET_STATUS_CLASS}}': self.get_model_status('mobilenet')['status_class'],
-            '{{DEIT_STATUS}}': self.get_model_status('deit')['status'],
-            '{{DEIT_STATUS_CLASS}}': self.get_model_status('deit')['status_class'],
-            '{{EFFICIENTNET_STATUS}}': self.get_model_status('efficientnet')['status'],
-            '{{EFFICIENTNET_STATUS_CLASS}}': self.get_model_status('efficientnet')['status_class'],
-            # Multimodal Models
-            '{{CLIP_STATUS}}': self.get_model_status('clip')['status'],
-            '{{CLIP_STATUS_CLASS}}': self.get_model_status('clip')['status_class'],
-            '{{WAV2VEC2_STATUS}}': self.get_model_status('wav2vec2')['status'],
-            '{{WAV2VEC2_STATUS_CLASS}}': self.get_model_status('wav2vec2')['status_class'],
+            'INFERENCE_METRICS_HTML': inference_metrics_html,
+            'MODEL_DETAILS_HTML': model_details_html,
+            'KERNEL_SECTION_HTML': self.generate_kernel_section_html(),
             
             # Metadata
-            '{{TIMESTAMP}}': self.metrics.get('timestamp', datetime.now().strftime('%Y-%m-%d %H:%M:%S')),
-            '{{TEST_DIR}}': self.metrics.get('test_dir', 'N/A'),
+            'TIMESTAMP': self.metrics.get('timestamp', datetime.now().strftime('%Y-%m-%d %H:%M:%S')),
+            'TEST_DIR': self.metrics.get('test_dir', 'N/A'),
         }
 
+        # Model-specific status (for Model Support section), one lookup per model
+        for model_name in SUPPORT_MATRIX_MODELS:
+            model_status = self.get_model_status(model_name)
+            key = model_name.upper()
+            replacements[f'{key}_STATUS'] = model_status['status']
+            replacements[f'{key}_STATUS_CLASS'] = model_status['status_class']
+
         return replacements
 
     def render_statistics_section(self) -> str:
@@ -1368,30 +1420,24 @@ class ReportRenderer:
         self.load_statistics()
         self.load_history()
 
-        # Load template
-        template = self.load_template()
-        if template is None:
-            return False
+        # Parse the template once per renderer
+        if self._segments is None:
+            try:
+                self._segments = parse_template(str(self.template_path))
+            except OSError:
+                # Let load_template report the missing/unreadable file
+                if self.load_template() is None:
+                    return False
+                raise
 
         # Build replacements
         replacements = self.build_replacements()
 
         # Add statistics section if available
         statistics_html = self.render_statistics_section()
-        replacements['{{STATISTICS_SECTION}}'] = statistics_html
+        replacements['STATISTICS_SECTION'] = statistics_html
         
-        # Apply replacements
-        content = template
-        for key, value in sorted(replacements.items(), key=lambda x: len(x[0]), reverse=True):
-            count = content.count(key)
-            if count > 0:
-                content = content.replace(key, str(value))
-                print(f"  Replaced {key}: {count} occurrence(s)")
-        
-        # Write output
-        self.output_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(self.output_path, 'w', encoding='utf-8') as f:
-            f.write(content)
+        write_template(self.output_path, self._segments, replacements)
         
         print(f"✅ Report generated: {self.output_path}")
         return True
@@ -1405,10 +1451,15 @@ class ModelsPageRenderer:
         self.template_path = Path(template_path)
         self.output_path = Path(output_path)
         self.config: Dict[str, Any] = {}
+        # Fixed when the renderer is created so repeated renders share one timestamp
+        self.timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
     
     def load_config(self) -> bool:
         """Load config from YAML file."""
-        if not HAS_YAML:
+        # PyYAML is only needed for this page, so it is imported on demand
+        try:
+            yaml_parser()
+        except ImportError:
             print("⚠️ PyYAML not installed, skipping models page")
             return False
         
@@ -1417,8 +1468,7 @@ class ModelsPageRenderer:
             return False
         
         try:
-            with open(self.config_path, 'r', encoding='utf-8') as f:
-                self.config = yaml.safe_load(f)
+            self.config = load_yaml_file(self.config_path)
             print(f"✅ Loaded config from {self.config_path}")
             return True
         except Exception as e:
@@ -1437,13 +1487,6 @@ class ModelsPageRenderer:
     def generate_model_card_html(self, name: str, data: Dict[str, Any]) -> str:
         """Generate HTML for a single model card."""
         enabled = data.get('enabled', False)
-        enabled_class = 'enabled' if enabled else 'disabled'
-        status_class = 'enabled' if enabled else 'disabled'
-        status_text = 'Enabled' if enabled else 'Disabled'
-        
-        description = data.get('description', 'No description')
-        axon_id = data.get('axon_id', 'N/A')
-        category = data.get('category', 'nlp')
         input_type = data.get('input_type', 'text')
         
         # Input specs
@@ -1452,85 +1495,64 @@ class ModelsPageRenderer:
         
         input_specs_html = ''
         if input_type == 'text':
-            small_tokens = small_input.get('tokens', 7)
-            large_tokens = large_input.get('tokens', 128)
-            input_specs_html = f'''
-                <table class="input-table">
-                    <tr><td>Small Test</td><td>{small_tokens} tokens</td></tr>
-                    <tr><td>Large Test</td><td>{large_tokens} tokens</td></tr>
-                </table>
-            '''
+            input_specs_html = _TEXT_SPECS_TEMPLATE.format_map({
+                'small_tokens': small_input.get('tokens', 7),
+                'large_tokens': large_input.get('tokens', 128),
+            })
         elif input_type == 'image':
-            small_w = small_input.get('width', 32)
-            small_h = small_input.get('height', 32)
-            large_w = large_input.get('width', 64)
-            large_h = large_input.get('height', 64)
-            channels = small_input.get('channels', 3)
-            input_specs_html = f'''
-                <table class="input-table">
-                    <tr><td>Small Test</td><td>{small_w}x{small_h}x{channels}</td></tr>
-                    <tr><td>Large Test</td><td>{large_w}x{large_h}x{channels}</td></tr>
-                </table>
-            '''
+            input_specs_html = _IMAGE_SPECS_TEMPLATE.format_map({
+                'small_w': small_input.get('width', 32),
+                'small_h': small_input.get('height', 32),
+                'large_w': large_input.get('width', 64),
+                'large_h': large_input.get('height', 64),
+                'channels': small_input.get('channels', 3),
+            })
         elif input_type == 'multimodal':
-            input_specs_html = '<p style="font-size: 0.8rem; color: var(--text-muted);">Text + Image input</p>'
+            input_specs_html = _MULTIMODAL_SPECS_HTML
         elif input_type == 'text_generation':
             # LLM models
-            small_prompt = small_input.get('prompt', 'N/A')[:30] + '...' if len(small_input.get('prompt', '')) > 30 else small_input.get('prompt', 'N/A')
-            small_tokens = small_input.get('max_tokens', 32)
-            large_tokens = large_input.get('max_tokens', 256)
-            format_type = data.get('format', 'gguf').upper()
-            input_specs_html = f'''
-                <table class="input-table">
-                    <tr><td>Format</td><td>{format_type}</td></tr>
-                    <tr><td>Small Test</td><td>{small_tokens} tokens</td></tr>
-                    <tr><td>Large Test</td><td>{large_tokens} tokens</td></tr>
-                </table>
-            '''
+            input_specs_html = _TEXT_GENERATION_SPECS_TEMPLATE.format_map({
+                'format_type': data.get('format', 'gguf').upper(),
+                'small_tokens': small_input.get('max_tokens', 32),
+                'large_tokens': large_input.get('max_tokens', 256),
+            })
         
         # Notes section
-        notes_html = ''
         notes = data.get('notes', '')
-        if notes:
-            notes_html = f'<div class="model-notes">⚠️ {notes}</div>'
+        notes_html = f'<div class="model-notes">⚠️ {notes}</div>' if notes else ''
         
-        return f'''
-            <div class="model-card {enabled_class}">
-                <div class="model-header">
-                    <h3 class="model-name">{name.replace('_', ' ').title()}</h3>
-                    <span class="model-status {status_class}">{status_text}</span>
-                </div>
-                <p class="model-description">{description}</p>
-                <div class="model-axon-id">{axon_id}</div>
-                <div class="model-meta">
-                    <div class="meta-item">
-                        <div class="meta-label">Category</div>
-                        <div class="meta-value">{category.upper()}</div>
-                    </div>
-                    <div class="meta-item">
-                        <div class="meta-label">Input Type</div>
-                        <div class="meta-value">{input_type.title()}</div>
-                    </div>
-                </div>
-                <div class="input-specs">
-                    <h4>Input Specifications</h4>
-                    {input_specs_html}
-                </div>
-                {notes_html}
-            </div>
-        '''
+        return _MODEL_CARD_TEMPLATE.format_map({
+            'enabled_class': 'enabled' if enabled else 'disabled',
+            'status_class': 'enabled' if enabled else 'disabled',
+            'status_text': 'Enabled' if enabled else 'Disabled',
+            'display_name': pretty_model_name(name),
+            'description': data.get('description', 'No description'),
+            'axon_id': data.get('axon_id', 'N/A'),
+            'category': data.get('category', 'nlp').upper(),
+            'input_type': input_type.title(),
+            'input_specs_html': input_specs_html,
+            'notes_html': notes_html,
+        })
     
     def build_replacements(self) -> Dict[str, str]:
         """Build all template replacements."""
         models = self.config.get('models', {})
 
-        # Count models by category
-        nlp_models = [(n, d) for n, d in models.items() if d.get('category') == 'nlp']
-        vision_models = [(n, d) for n, d in models.items() if d.get('category') == 'vision']
-        multimodal_models = [(n, d) for n, d in models.items() if d.get('category') == 'multimodal']
-        llm_models = [(n, d) for n, d in models.items() if d.get('category') == 'llm']
-
-        enabled_count = sum(1 for d in models.values() if d.get('enabled', False))
+        # Partition models by category and count enabled ones in one pass;
+        # models with any other category are only counted in the totals
+        nlp_models, vision_models, multimodal_models, llm_models = [], [], [], []
+        buckets = {
+            'nlp': nlp_models,
+            'vision': vision_models,
+            'multimodal': multimodal_models,
+            'llm': llm_models,
+        }
+        enabled_count = 0
+        for n, d in models.items():
+            bucket = buckets.get(d.get('category'))
+            if bucket is not None:
+                bucket.append((n, d))
+            enabled_count += bool(d.get('enabled', False))
 
         # Generate HTML for each category
         nlp_html = '\n'.join(self.generate_model_card_html(n, d) for n, d in nlp_models) or '<p class="no-models">No NLP models configured</p>'
@@ -1539,17 +1561,17 @@ class ModelsPageRenderer:
         llm_html = '\n'.join(self.generate_model_card_html(n, d) for n, d in llm_models) or '<p class="no-models">No LLM models configured</p>'
 
         return {
-            '{{TOTAL_MODELS}}': str(len(models)),
-            '{{ENABLED_MODELS}}': str(enabled_count),
-            '{{NLP_COUNT}}': str(len(nlp_models)),
-            '{{VISION_COUNT}}': str(len(vision_models)),
-            '{{MULTIMODAL_COUNT}}': str(len(multimodal_models)),
-            '{{LLM_COUNT}}': str(len(llm_models)),
-            '{{NLP_MODELS_HTML}}': nlp_html,
-            '{{VISION_MODELS_HTML}}': vision_html,
-            '{{MULTIMODAL_MODELS_HTML}}': multimodal_html,
-            '{{LLM_MODELS_HTML}}': llm_html,
-            '{{TIMESTAMP}}': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+            'TOTAL_MODELS': str(len(models)),
+            'ENABLED_MODELS': str(enabled_count),
+            'NLP_COUNT': str(len(nlp_models)),
+            'VISION_COUNT': str(len(vision_models)),
+            'MULTIMODAL_COUNT': str(len(multimodal_models)),
+            'LLM_COUNT': str(len(llm_models)),
+            'NLP_MODELS_HTML': nlp_html,
+            'VISION_MODELS_HTML': vision_html,
+            'MULTIMODAL_MODELS_HTML': multimodal_html,
+            'LLM_MODELS_HTML': llm_html,
+            'TIMESTAMP': self.timestamp,
         }
     
     def render(self) -> bool:
@@ -1557,19 +1579,17 @@ class ModelsPageRenderer:
         if not self.load_config():
             return False
         
-        template = self.load_template()
-        if template is None:
-            return False
+        try:
+            segments = parse_template(str(self.template_path))
+        except OSError:
+            # Let load_template report the missing/unreadable file
+            if self.load_template() is None:
+                return False
+            raise
         
         replacements = self.build_replacements()
         
-        content = template
-        for key, value in sorted(replacements.items(), key=lambda x: len(x[0]), reverse=True):
-            content = content.replace(key, str(value))
-        
-        self.output_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(self.output_path, 'w', encoding='utf-8') as f:
-            f.write(content)
+        write_template(self.output_path, segments, replacements)
         
         print(f"✅ Models page generated: {self.output_path}")
         return True
@@ -1590,7 +1610,10 @@ class TestDetailsPageRenderer:
 
     def load_data(self) -> bool:
         """Load golden test data, metrics, and validation results."""
-        if not HAS_YAML:
+        # PyYAML is only needed for this page, so it is imported on demand
+        try:
+            yaml_parser()
+        except ImportError:
             print("⚠️ PyYAML not installed, skipping test details page")
             return False
 
@@ -1600,8 +1623,7 @@ class TestDetailsPageRenderer:
             return False
 
         try:
-            with open(self.golden_data_path, 'r', encoding='utf-8') as f:
-                self.golden_data = yaml.safe_load(f)
+            self.golden_data = load_yaml_file(self.golden_data_path)
             print(f"✅ Loaded golden data from {self.golden_data_path}")
         except Exception as e:
             print(f"❌ Error loading golden data: {e}")
@@ -1637,15 +1659,19 @@ class TestDetailsPageRenderer:
             print(f"⚠️ Model results directory not found: {results_dir}")
             return
 
+        # One listing serves all the loaders below; the suffix checks replace
+        # per-pattern Path.glob() scans (and a Path object per entry)
+        with os.scandir(results_dir) as entries:
+            file_names = [entry.name for entry in entries if entry.is_file()]
+
         # Load both small and large validation files (LLMs have separate files per test size)
-        for pattern in ["*-validation-small.json", "*-validation-large.json"]:
-            for validation_file in results_dir.glob(pattern):
-                # Extract model name and size from filename
-                stem = validation_file.stem
-                if "-validation-small" in stem:
-                    model_name = stem.replace("-validation-small", "")
-                else:
-                    model_name = stem.replace("-validation-large", "")
+        for suffix in ("-validation-small.json", "-validation-large.json"):
+            for file_name in file_names:
+                if not file_name.endswith(suffix):
+                    continue
+                # Extract model name from filename
+                model_name = file_name[:-len(suffix)]
+                validation_file = results_dir / file_name
 
                 try:
                     with open(validation_file, 'r', encoding='utf-8') as f:
@@ -1657,26 +1683,28 @@ class TestDetailsPageRenderer:
                             test_name = r.get('test_name', '')
                             if test_name not in self.validation_results[model_name]:
                                 self.validation_results[model_name][test_name] = r
-                    print(f"  📊 Loaded validation results for {model_name} from {validation_file.name}")
+                    print(f"  📊 Loaded validation results for {model_name} from {file_name}")
                 except Exception as e:
                     print(f"  ⚠️ Failed to load validation for {model_name}: {e}")
 
         # Load golden image validation files
-        self._load_golden_validation_results(results_dir)
+        self._load_golden_validation_results(results_dir, file_names)
 
         # Also load response files to get actual inference output data
-        self._load_response_data(results_dir)
+        self._load_response_data(results_dir, file_names)
 
-    def _load_golden_validation_results(self, results_dir: Path) -> None:
+    def _load_golden_validation_results(self, results_dir: Path, file_names: List[str]) -> None:
         """Load golden image validation results from model-results/{model}-validation-golden-*.json files."""
         if not hasattr(self, 'golden_validation_results'):
             self.golden_validation_results = {}
 
-        for validation_file in results_dir.glob("*-validation-golden-*.json"):
+        for file_name in file_names:
+            if '-validation-golden-' not in file_name or not file_name.endswith('.json'):
+                continue
+            validation_file = results_dir / file_name
             # Extract model name and test name from filename
             # Format: {model}-validation-golden-{test_name}.json
-            stem = validation_file.stem
-            parts = stem.split('-validation-golden-')
+            parts = file_name[:-len('.json')].split('-validation-golden-')
             if len(parts) == 2:
                 model_name = parts[0]
                 test_name = parts[1]
@@ -1696,13 +1724,17 @@ class TestDetailsPageRenderer:
             except Exception as e:
                 print(f"  ⚠️ Failed to load golden validation for {model_name}/{test_name}: {e}")
 
-    def _load_response_data(self, results_dir: Path) -> None:
+    def _load_response_data(self, results_dir: Path, file_names: List[str]) -> None:
         """Load inference response data from model-results/{model}-response-small.json files."""
         if not hasattr(self, 'response_data'):
             self.response_data = {}
 
-        for response_file in results_dir.glob("*-response-small.json"):
-            model_name = response_file.stem.replace("-response-small", "")
+        suffix = "-response-small.json"
+        for file_name in file_names:
+            if not file_name.endswith(suffix):
+                continue
+            response_file = results_dir / file_name
+            model_name = file_name[:-len(suffix)]
             try:
                 with open(response_file, 'r', encoding='utf-8') as f:
                     data = json.load(f)
@@ -2242,13 +2274,13 @@ class TestDetailsPageRenderer:
                         total_failed += 1
 
         return {
-            '{{TOTAL_PASSED}}': str(total_passed),
-            '{{TOTAL_FAILED}}': str(total_failed),
-            '{{TOTAL_MODELS}}': str(len(models)),
-            '{{TOTAL_TEST_CASES}}': str(total_tests),
-            '{{MODEL_TEST_DETAILS_HTML}}': '\n'.join(html_parts),
-            '{{GOLDEN_IMAGE_TESTS_HTML}}': self.generate_golden_image_tests_html(),
-            '{{TIMESTAMP}}': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+            'TOTAL_PASSED': str(total_passed),
+            'TOTAL_FAILED': str(total_failed),
+            'TOTAL_MODELS': str(len(models)),
+            'TOTAL_TEST_CASES': str(total_tests),
+            'MODEL_TEST_DETAILS_HTML': '\n'.join(html_parts),
+            'GOLDEN_IMAGE_TESTS_HTML': self.generate_golden_image_tests_html(),
+            'TIMESTAMP': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
         }
 
     def render(self) -> bool:
@@ -2256,19 +2288,17 @@ class TestDetailsPageRenderer:
         if not self.load_data():
             return False
 
-        template = self.load_template()
-        if template is None:
-            return False
+        try:
+            segments = parse_template(str(self.template_path))
+        except OSError:
+            # Let load_template report the missing/unreadable file
+            if self.load_template() is None:
+                return False
+            raise
 
         replacements = self.build_replacements()
 
-        content = template
-        for key, value in sorted(replacements.items(), key=lambda x: len(x[0]), reverse=True):
-            content = content.replace(key, str(value))
-
-        self.output_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(self.output_path, 'w', encoding='utf-8') as f:
-            f.write(content)
+        write_template(self.output_path, segments, replacements)
 
         print(f"✅ Test details page generated: {self.output_path}")
         return True
@@ -2277,7 +2307,7 @@ class TestDetailsPageRenderer:
 def main():
     parser = argparse.ArgumentParser(description='Render MLOS E2E test report')
     parser.add_argument('--metrics', default='scripts/metrics/latest.json',
-                        help='Path to metrics JSON file')
+                        help='Path to metrics JSON file (or a .msgpack copy)')
     parser.add_argument('--template', default='report/template.html',
                         help='Path to HTML template')
     parser.add_argument('--output', default='output/index.html',
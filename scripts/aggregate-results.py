@@ -4,14 +4,273 @@ Aggregate results from parallel model test pipelines.
 
 Usage:
     python aggregate-results.py --results-dir ./model-results --output metrics.json
+    python aggregate-results.py --results-ndjson ./all-results.ndjson --output metrics.json
+    python aggregate-results.py --results-dir ./model-results --output metrics.json --binary-output metrics.msgpack
 """
 
 import argparse
 import json
+import mmap
 import os
+import re
+import stat
 import sys
-from datetime import datetime
+import tempfile
+import time
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from types import MappingProxyType
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+try:
+    import msgpack
+    HAS_MSGPACK = True
+except ImportError:
+    HAS_MSGPACK = False
+
+
+# Model categories (from config); read-only so callers can't mutate the shared table
+MODEL_CATEGORIES = MappingProxyType({
+    # NLP models
+    'gpt2': 'nlp', 'bert': 'nlp', 'roberta': 'nlp', 't5': 'nlp',
+    'distilbert': 'nlp', 'albert': 'nlp', 'sentence-transformers': 'nlp',
+    # Embedding models (NLP)
+    'bge-small': 'nlp', 'bge-base': 'nlp', 'e5-small': 'nlp',
+    'e5-base': 'nlp', 'gte-small': 'nlp', 'gte-base': 'nlp',
+    # Vision models
+    'resnet': 'vision', 'vit': 'vision', 'convnext': 'vision',
+    'mobilenet': 'vision', 'deit': 'vision', 'efficientnet': 'vision', 'swin': 'vision',
+    'detr': 'vision', 'segformer': 'vision',
+    # Multimodal models
+    'clip': 'multimodal', 'wav2vec2': 'multimodal',
+    # LLM models (GGUF format)
+    'tinyllama': 'llm', 'phi2': 'llm', 'qwen2-0.5b': 'llm',
+    'llama-3.2-1b': 'llm', 'llama-3.2-3b': 'llm',
+    'deepseek-coder-1.3b': 'llm', 'deepseek-llm-7b': 'llm'
+})
+
+
+def _build_category_pattern(categories) -> re.Pattern:
+    """Compile one regex with a named group per category over its model names."""
+    names_by_category = {}
+    for name, category in categories.items():
+        names_by_category.setdefault(category, []).append(re.escape(name))
+    groups = "|".join(f"(?P<{cat}>{'|'.join(names)})" for cat, names in names_by_category.items())
+    return re.compile(f"(?:{groups})(?:[-_.]|$)")
+
+
+# Variants of a known model (e.g. gpt2-medium, vit_large) take the base model's category
+MODEL_CATEGORY_RE = _build_category_pattern(MODEL_CATEGORIES)
+
+
+def model_category(model_name: str, default: str = "nlp") -> str:
+    """Category for a model name, matching variants of known models by prefix."""
+    category = MODEL_CATEGORIES.get(model_name)
+    if category is None:
+        match = MODEL_CATEGORY_RE.match(model_name)
+        category = match.lastgroup if match else default
+    return category
+
+
+# Placeholders used when the runner didn't provide hardware, timing or resource info
+DEFAULT_HARDWARE = MappingProxyType({
+    "os": "Linux",
+    "os_version": "Unknown",
+    "arch": "x86_64",
+    "cpu_model": "Unknown",
+    "cpu_cores": 2,
+    "cpu_threads": 2,
+    "memory_gb": 7,
+    "gpu_count": 0,
+    "gpu_name": "None",
+    "gpu_memory": "N/A",
+    "disk_total": "N/A",
+    "disk_available": "N/A"
+})
+
+DEFAULT_SETUP_TIMINGS = MappingProxyType({
+    "axon_download_ms": 0,
+    "core_download_ms": 0,
+    "core_startup_ms": 0
+})
+
+DEFAULT_RESOURCES = MappingProxyType({
+    "core_idle_cpu": 0,
+    "core_idle_mem_mb": 0,
+    "core_load_cpu_avg": 0,
+    "core_load_cpu_max": 0,
+    "core_load_mem_avg_mb": 0,
+    "core_load_mem_max_mb": 0,
+    "axon_cpu": 0,
+    "axon_mem_mb": 0,
+    "gpu_status": "Not used (CPU-only inference)"
+})
+
+# The only top-level result fields aggregate_results reads; everything else in
+# a result file is dropped as soon as it is parsed
+RESULT_FIELDS = ("model_name", "status", "phases", "total_time_ms")
+
+# Result files above this size are parsed from an mmap rather than a read() copy
+MMAP_THRESHOLD = 1 << 20
+
+
+def _read_umask() -> int:
+    """Return the process umask (os.umask can only read it by setting it)."""
+    umask = os.umask(0)
+    os.umask(umask)
+    return umask
+
+
+# Read once at import, before any worker threads exist, since reading it
+# briefly changes the umask for the whole process
+UMASK = _read_umask()
+
+# Stand-in for a missing result section, shared so the hot loop doesn't allocate
+# a fresh {} per lookup (read-only so nothing can leak between results)
+_EMPTY = MappingProxyType({})
+
+# Markdown status marker per model status; anything else is shown as failed
+STATUS_EMOJI = MappingProxyType({"success": "✅", "partial": "⚠️"})
+
+# Markdown report header and overview table, formatted once per report
+MARKDOWN_HEADER_TEMPLATE = (
+    "# E2E Test Results Summary\n"
+    "\n"
+    "Generated: {generated_at}\n"
+    "\n"
+    "## Overview\n"
+    "\n"
+    "| Metric | Value |\n"
+    "|--------|-------|\n"
+    "| Total Models | {total_models} |\n"
+    "| Successful | {successful_models} |\n"
+    "| Partial | {partial_models} |\n"
+    "| Failed | {failed_models} |\n"
+    "| Success Rate | {success_rate}% |\n"
+    "| Total Inferences | {successful_inferences}/{total_inferences} |\n"
+    "| Total Time | {total_time_ms}ms |\n"
+    "\n"
+    "## Model Details\n"
+)
+
+# One model's section of the markdown report; the leading newline leaves a
+# blank line after the header or the previous section
+MODEL_MARKDOWN_TEMPLATE = (
+    "\n"
+    "### {emoji} {name}\n"
+    "\n"
+    "- **Category**: {category}\n"
+    "- **Install**: {install_time_ms}ms\n"
+    "- **Register**: {register_time_ms}ms\n"
+    "- **Inference (small)**: {inference_time_ms}ms - {inference_status}\n"
+    "- **Inference (large)**: {inference_large_time_ms}ms - {inference_large_status}\n"
+)
+
+# Values for fields a summary may lack; the templates are filled straight from
+# the summary and model dicts layered over these (generated_at, total_models and
+# successful_models are required)
+MARKDOWN_HEADER_DEFAULTS = MappingProxyType({
+    "partial_models": 0,
+    "failed_models": 0,
+    "success_rate": 0,
+    "successful_inferences": 0,
+    "total_inferences": 0,
+    "total_time_ms": 0,
+})
+MODEL_MARKDOWN_DEFAULTS = MappingProxyType({
+    "category": "unknown",
+    "install_time_ms": 0,
+    "register_time_ms": 0,
+    "inference_time_ms": 0,
+    "inference_status": "N/A",
+    "inference_large_time_ms": 0,
+    "inference_large_status": "N/A",
+})
+
+
+def _intern_status(value):
+    """Intern a status string read from JSON so repeats share one object."""
+    return sys.intern(value) if type(value) is str else value
+
+
+def load_json_file(path) -> object:
+    """Parse a JSON file, using orjson when it is installed.
+    
+    orjson parses the raw bytes directly, skipping the text-mode decode; files
+    over MMAP_THRESHOLD bytes are parsed straight off a read-only mapping
+    instead of being copied into a buffer first. An empty file is rejected
+    without reading it. orjson.JSONDecodeError subclasses json.JSONDecodeError
+    (a ValueError), so callers only need to catch the latter.
+    """
+    with open(path, 'rb') as f:
+        size = os.fstat(f.fileno()).st_size
+        if size == 0:
+            raise json.JSONDecodeError("Empty file", "", 0)
+        if not HAS_ORJSON:
+            return json.load(f)
+        if size <= MMAP_THRESHOLD:
+            return orjson.loads(f.read())
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped, memoryview(mapped) as view:
+            return orjson.loads(view)
+
+
+def _load_result_file(result_file: str) -> tuple:
+    """Load one model result file.
+    
+    Returns (data, warning); exactly one of them is None, so callers can report
+    problems in file order even when files are loaded concurrently.
+    """
+    try:
+        parsed = load_json_file(result_file)
+        if not isinstance(parsed, dict):
+            return None, f"Warning: Error reading {result_file}: expected a JSON object"
+        # Keep just what aggregation needs so the rest of the tree can be freed
+        # while the other files load
+        data = {key: parsed[key] for key in RESULT_FIELDS if key in parsed}
+        data['_source_file'] = result_file
+        return data, None
+    except json.JSONDecodeError as e:  # also covers orjson.JSONDecodeError
+        return None, f"Warning: Could not parse {result_file}: {e}"
+    except Exception as e:
+        return None, f"Warning: Error reading {result_file}: {e}"
+
+
+def stream_results_ndjson(ndjson_file: str) -> Iterator[dict]:
+    """Yield model results one at a time from a newline-delimited JSON file.
+    
+    Only one line is held in memory at a time, so a combined artifact of any
+    size can be fed straight into aggregate_results. Blank lines are skipped;
+    lines that don't parse to an object are reported and skipped.
+    """
+    if not os.path.isfile(ndjson_file):
+        print(f"Warning: Results file not found: {ndjson_file}")
+        return
+    
+    loads = orjson.loads if HAS_ORJSON else json.loads
+    with open(ndjson_file, 'rb') as f:
+        for line_number, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+            source = f"{ndjson_file}:{line_number}"
+            try:
+                parsed = loads(line)
+            except ValueError as e:
+                # JSONDecodeError (json or orjson), or UnicodeDecodeError when
+                # json.loads is handed a line that isn't valid UTF-8
+                print(f"Warning: Could not parse {source}: {e}")
+                continue
+            if not isinstance(parsed, dict):
+                print(f"Warning: Error reading {source}: expected a JSON object")
+                continue
+            data = {key: parsed[key] for key in RESULT_FIELDS if key in parsed}
+            data['_source_file'] = source
+            yield data
 
 
 def load_result_files(results_dir: str) -> list:
@@ -23,23 +282,44 @@ def load_result_files(results_dir: str) -> list:
         print(f"Warning: Results directory not found: {results_dir}")
         return results
     
-    for result_file in results_path.glob("*-result.json"):
-        try:
-            with open(result_file) as f:
-                data = json.load(f)
-                data['_source_file'] = str(result_file)
-                results.append(data)
-        except json.JSONDecodeError as e:
-            print(f"Warning: Could not parse {result_file}: {e}")
-        except Exception as e:
-            print(f"Warning: Error reading {result_file}: {e}")
+    # Plain path strings from scandir; no Path object per entry
+    with os.scandir(results_dir) as entries:
+        result_files = [
+            entry.path for entry in entries
+            if entry.name.endswith("-result.json") and entry.is_file()
+        ]
+    
+    # Reading and parsing is independent per file, so overlap the I/O; a pool
+    # isn't worth starting for a single file. Capped like ThreadPoolExecutor's
+    # own default, which leaves headroom for slow or network-mounted storage
+    workers = min(32, (os.cpu_count() or 1) + 4, len(result_files))
+    if workers > 1:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            loaded = list(executor.map(_load_result_file, result_files))
+    else:
+        loaded = [_load_result_file(result_file) for result_file in result_files]
+    
+    for data, warning in loaded:
+        if warning:
+            print(warning)
+        else:
+            results.append(data)
     
     return results
 
 
-def aggregate_results(results: list, hardware: dict = None, setup_timings: dict = None, resources: dict = None) -> dict:
+def utc_timestamp() -> str:
+    """Current UTC time as an ISO 8601 string with a Z suffix (second precision)."""
+    return time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
+
+
+def aggregate_results(results: Iterable[dict], hardware: dict = None, setup_timings: dict = None, resources: dict = None,
+                      generated_at: str = None) -> dict:
     """Aggregate individual model results into a summary.
     
+    results may be any iterable (e.g. stream_results_ndjson); it is consumed
+    in a single pass.
+    
     Output format is compatible with report/render.py which expects:
     - models.{name}.tested (bool)
     - models.{name}.inference_status ('success'|'failed')
@@ -48,75 +328,24 @@ def aggregate_results(results: list, hardware: dict = None, setup_timings: dict
     - models.{name}.inference_time_ms (int)
     - models.{name}.category ('nlp'|'vision'|'multimodal')
     """
-    
-    # Model categories (from config)
-    MODEL_CATEGORIES = {
-        # NLP models
-        'gpt2': 'nlp', 'bert': 'nlp', 'roberta': 'nlp', 't5': 'nlp',
-        'distilbert': 'nlp', 'albert': 'nlp', 'sentence-transformers': 'nlp',
-        # Embedding models (NLP)
-        'bge-small': 'nlp', 'bge-base': 'nlp', 'e5-small': 'nlp',
-        'e5-base': 'nlp', 'gte-small': 'nlp', 'gte-base': 'nlp',
-        # Vision models
-        'resnet': 'vision', 'vit': 'vision', 'convnext': 'vision',
-        'mobilenet': 'vision', 'deit': 'vision', 'efficientnet': 'vision', 'swin': 'vision',
-        'detr': 'vision', 'segformer': 'vision',
-        # Multimodal models
-        'clip': 'multimodal', 'wav2vec2': 'multimodal',
-        # LLM models (GGUF format)
-        'tinyllama': 'llm', 'phi2': 'llm', 'qwen2-0.5b': 'llm',
-        'llama-3.2-1b': 'llm', 'llama-3.2-3b': 'llm',
-        'deepseek-coder-1.3b': 'llm', 'deepseek-llm-7b': 'llm'
-    }
-    
-    total_inferences = 0
-    successful_inferences = 0
-    total_install_time = 0
-    total_register_time = 0
-    total_inference_time = 0
-    
-    # Use provided hardware info or defaults
+    # Running totals kept in locals and written into the summary once at the end
+    total_models = successful_models = partial_models = 0
+    total_inferences = successful_inferences = 0
+    total_install_ms = total_register_ms = total_inference_ms = total_time = 0
+    model_entries = []
+    
+    # Use provided hardware info, setup timings and resources or the defaults;
+    # hardware/resources end up in the summary, so they get their own copies
     if hardware is None:
-        hardware = {
-            "os": "Linux",
-            "os_version": "Unknown",
-            "arch": "x86_64",
-            "cpu_model": "Unknown",
-            "cpu_cores": 2,
-            "cpu_threads": 2,
-            "memory_gb": 7,
-            "gpu_count": 0,
-            "gpu_name": "None",
-            "gpu_memory": "N/A",
-            "disk_total": "N/A",
-            "disk_available": "N/A"
-        }
-    
-    # Use provided setup timings or defaults
+        hardware = dict(DEFAULT_HARDWARE)
     if setup_timings is None:
-        setup_timings = {
-            "axon_download_ms": 0,
-            "core_download_ms": 0,
-            "core_startup_ms": 0
-        }
-    
-    # Use provided resources or defaults
+        setup_timings = DEFAULT_SETUP_TIMINGS
     if resources is None:
-        resources = {
-            "core_idle_cpu": 0,
-            "core_idle_mem_mb": 0,
-            "core_load_cpu_avg": 0,
-            "core_load_cpu_max": 0,
-            "core_load_mem_avg_mb": 0,
-            "core_load_mem_max_mb": 0,
-            "axon_cpu": 0,
-            "axon_mem_mb": 0,
-            "gpu_status": "Not used (CPU-only inference)"
-        }
+        resources = dict(DEFAULT_RESOURCES)
     
     summary = {
-        "generated_at": datetime.utcnow().isoformat() + "Z",
-        "total_models": len(results),
+        "generated_at": generated_at or utc_timestamp(),
+        "total_models": 0,
         "successful_models": 0,
         "partial_models": 0,
         "failed_models": 0,
@@ -147,235 +376,231 @@ def aggregate_results(results: list, hardware: dict = None, setup_timings: dict
     }
     
     for result in results:
-        model_name = result.get("model_name", "unknown")
-        status = result.get("status", "unknown")
-        phases = result.get("phases", {})
-        
-        # Count overall status
-        if status == "success":
-            summary["successful_models"] += 1
-        elif status == "partial":
-            summary["partial_models"] += 1
-        else:
-            summary["failed_models"] += 1
+        result_get = result.get
+        model_name = result_get("model_name", "unknown")
+        status = _intern_status(result_get("status", "unknown"))
+        phases = result_get("phases") or _EMPTY
+        total_time_ms = result_get("total_time_ms", 0)
         
         # NOTE: Version info comes from environment variables (AXON_VERSION, CORE_VERSION)
         # set at workflow level. Do NOT override from result files as they may have stale data.
         
-        # Build model entry in format render.py expects
-        install_phase = phases.get("install", {})
-        register_phase = phases.get("register", {})
-        inference_small = phases.get("inference_small", {})
-        inference_large = phases.get("inference_large", {})
-        
-        install_time = install_phase.get("time_ms", 0)
-        register_time = register_phase.get("time_ms", 0)
-        inference_time = inference_small.get("time_ms", 0)
-        inference_large_time = inference_large.get("time_ms", 0)
-        
-        total_install_time += install_time
-        total_register_time += register_time
-        total_inference_time += inference_time + inference_large_time
+        # Build model entry in format render.py expects. One pass over the
+        # phases builds the detailed view and picks out the phases render.py
+        # reads; raw statuses stay None when the phase didn't run
+        install_status = small_status = large_status = None
+        # Reported statuses: "not_tested" only when the status key is absent;
+        # an explicit null status is passed through as None
+        inference_status = inference_large_status = "not_tested"
+        install_time = register_time = inference_time = inference_large_time = 0
+        phase_summaries = {}
+        for phase_name, phase_data in phases.items():
+            # Plain dicts (not objects) since the summary is the JSON contract;
+            # each entry is built complete instead of patched after insertion
+            phase_get = (phase_data or _EMPTY).get
+            phase_status = _intern_status(phase_get("status"))
+            time_ms = phase_get("time_ms", 0)
+            shown_status = phase_status if phase_status is not None else "unknown"
+            error = phase_get("error")
+            if error:
+                phase_summaries[phase_name] = {"status": shown_status, "time_ms": time_ms, "error": error}
+            else:
+                phase_summaries[phase_name] = {"status": shown_status, "time_ms": time_ms}
+            
+            if phase_name == "install":
+                install_status, install_time = phase_status, time_ms
+            elif phase_name == "register":
+                register_time = time_ms
+            elif phase_name == "inference_small":
+                small_status, inference_time = phase_status, time_ms
+                inference_status = phase_get("status", "not_tested")
+            elif phase_name == "inference_large":
+                large_status, inference_large_time = phase_status, time_ms
+                inference_large_status = phase_get("status", "not_tested")
         
-        # Determine inference status
-        inference_status = inference_small.get("status", "not_tested")
-        inference_large_status = inference_large.get("status", "not_tested")
+        total_models += 1
+        if status == "success":
+            successful_models += 1
+        elif status == "partial":
+            partial_models += 1
+        total_install_ms += install_time
+        total_register_ms += register_time
+        total_inference_ms += inference_time + inference_large_time
+        total_time += total_time_ms
         
-        # Count inferences
-        if inference_small.get("status"):
-            total_inferences += 1
-            if inference_status == "success":
-                successful_inferences += 1
-        if inference_large.get("status"):
-            total_inferences += 1
-            if inference_large_status == "success":
-                successful_inferences += 1
+        # Count inferences (phases that ran, and how many of those succeeded)
+        for phase_status in (small_status, large_status):
+            if phase_status:
+                total_inferences += 1
+                successful_inferences += phase_status == "success"
         
+        # A plain dict rather than a slotted record: it is emitted as-is by the
+        # JSON writer and read back with .get() by the markdown report, and
+        # its key literals are constants shared by every model's entry
         model_summary = {
             # Fields expected by render.py
-            "tested": install_phase.get("status") == "success",
-            "category": MODEL_CATEGORIES.get(model_name, "nlp"),
+            "tested": install_status == "success",
+            "category": model_category(model_name),
             "install_time_ms": install_time,
             "register_time_ms": register_time,
             "inference_time_ms": inference_time,
             "inference_large_time_ms": inference_large_time,
             "inference_status": inference_status,
             "inference_large_status": inference_large_status,
-            "inference_large_tested": inference_large.get("status") is not None,
+            "inference_large_tested": large_status is not None,
             "status": status,
             # Also keep phases for detailed view
-            "phases": {}
+            "phases": phase_summaries
         }
         
-        for phase_name, phase_data in phases.items():
-            model_summary["phases"][phase_name] = {
-                "status": phase_data.get("status", "unknown"),
-                "time_ms": phase_data.get("time_ms", 0)
-            }
-            if phase_data.get("error"):
-                model_summary["phases"][phase_name]["error"] = phase_data["error"]
-        
-        model_summary["total_time_ms"] = result.get("total_time_ms", 0)
-        summary["models"][model_name] = model_summary
-        summary["total_time_ms"] += result.get("total_time_ms", 0)
-    
-    # Update inference counts
-    summary["total_inferences"] = total_inferences
-    summary["successful_inferences"] = successful_inferences
-    
-    # Update timings
-    summary["timings"]["total_model_install_ms"] = total_install_time
-    summary["timings"]["total_register_ms"] = total_register_time
-    summary["timings"]["total_inference_ms"] = total_inference_time
-    summary["timings"]["total_duration_s"] = round(summary["total_time_ms"] / 1000, 1)
-    
-    # Calculate success rates
-    if summary["total_models"] > 0:
-        summary["success_rate"] = round(
-            (summary["successful_models"] / summary["total_models"]) * 100, 2
-        )
-    else:
-        summary["success_rate"] = 0
+        model_summary["total_time_ms"] = total_time_ms
+        model_entries.append((model_name, model_summary))
+    
+    summary.update({
+        "total_models": total_models,
+        "successful_models": successful_models,
+        "partial_models": partial_models,
+        "failed_models": total_models - successful_models - partial_models,
+        "total_inferences": total_inferences,
+        "successful_inferences": successful_inferences,
+        # Build the models table in one go rather than growing it per result
+        "models": dict(model_entries),
+        "total_time_ms": total_time,
+        # Calculate success rates
+        "success_rate": round((successful_models / total_models) * 100, 2) if total_models > 0 else 0,
+    })
+    summary["timings"].update({
+        "total_model_install_ms": total_install_ms,
+        "total_register_ms": total_register_ms,
+        "total_inference_ms": total_inference_ms,
+        "total_duration_s": round(total_time / 1000, 1),
+    })
     
     return summary
 
 
-def generate_markdown_report(summary: dict) -> str:
-    """Generate a markdown summary report."""
-    total_inferences = summary.get('total_inferences', 0)
-    successful_inferences = summary.get('successful_inferences', 0)
-    
-    lines = [
-        "# E2E Test Results Summary",
-        "",
-        f"Generated: {summary['generated_at']}",
-        "",
-        "## Overview",
-        "",
-        f"| Metric | Value |",
-        f"|--------|-------|",
-        f"| Total Models | {summary['total_models']} |",
-        f"| Successful | {summary['successful_models']} |",
-        f"| Partial | {summary.get('partial_models', 0)} |",
-        f"| Failed | {summary.get('failed_models', 0)} |",
-        f"| Success Rate | {summary.get('success_rate', 0)}% |",
-        f"| Total Inferences | {successful_inferences}/{total_inferences} |",
-        f"| Total Time | {summary.get('total_time_ms', 0)}ms |",
-        "",
-        "## Model Details",
-        "",
-    ]
+def iter_markdown_report(summary: dict):
+    """Yield the markdown summary report in chunks (header, then one per model).
     
-    for model_name, model_data in summary.get("models", {}).items():
-        status_emoji = "✅" if model_data.get("status") == "success" else "⚠️" if model_data.get("status") == "partial" else "❌"
-        lines.append(f"### {status_emoji} {model_name.upper()}")
-        lines.append("")
-        lines.append(f"- **Category**: {model_data.get('category', 'unknown')}")
-        lines.append(f"- **Install**: {model_data.get('install_time_ms', 0)}ms")
-        lines.append(f"- **Register**: {model_data.get('register_time_ms', 0)}ms")
-        lines.append(f"- **Inference (small)**: {model_data.get('inference_time_ms', 0)}ms - {model_data.get('inference_status', 'N/A')}")
-        lines.append(f"- **Inference (large)**: {model_data.get('inference_large_time_ms', 0)}ms - {model_data.get('inference_large_status', 'N/A')}")
-        lines.append("")
+    Lets callers write the report straight to a file without building the
+    whole text first.
+    """
+    yield MARKDOWN_HEADER_TEMPLATE.format_map({**MARKDOWN_HEADER_DEFAULTS, **summary})
     
-    return "\n".join(lines)
+    status_emoji = STATUS_EMOJI.get
+    for model_name, model_data in summary.get("models", {}).items():
+        yield MODEL_MARKDOWN_TEMPLATE.format_map({
+            **MODEL_MARKDOWN_DEFAULTS,
+            **model_data,
+            "emoji": status_emoji(model_data.get("status"), "❌"),
+            "name": model_name.upper(),
+        })
 
 
-def load_hardware_info(hardware_file: str) -> dict:
-    """Load hardware info from JSON file."""
-    default_hardware = {
-        "os": "Linux",
-        "os_version": "Unknown",
-        "arch": "x86_64",
-        "cpu_model": "Unknown",
-        "cpu_cores": 2,
-        "cpu_threads": 2,
-        "memory_gb": 7,
-        "gpu_count": 0,
-        "gpu_name": "None",
-        "gpu_memory": "N/A",
-        "disk_total": "N/A",
-        "disk_available": "N/A"
-    }
-    
-    if not hardware_file or not os.path.exists(hardware_file):
-        return default_hardware
+def generate_markdown_report(summary: dict) -> str:
+    """Generate a markdown summary report."""
+    return "".join(iter_markdown_report(summary))
+
+
+def _load_info(info_file: str, defaults, kind: str) -> dict:
+    """Load an info JSON file, filling in any fields it lacks from defaults."""
+    if not info_file:
+        return dict(defaults)
     
     try:
-        with open(hardware_file) as f:
-            hardware = json.load(f)
-            # Merge with defaults for any missing fields
-            for key, value in default_hardware.items():
-                if key not in hardware:
-                    hardware[key] = value
-            return hardware
+        info = load_json_file(info_file)
+        # Merge with defaults for any missing fields (loaded fields keep their order)
+        for key, value in defaults.items():
+            info.setdefault(key, value)
+        return info
+    except FileNotFoundError:
+        # Not an error: the runner just didn't provide this info (no separate
+        # exists() check, so no extra stat and no race with the open)
+        return dict(defaults)
     except Exception as e:
-        print(f"Warning: Could not load hardware info: {e}")
-        return default_hardware
+        print(f"Warning: Could not load {kind} info: {e}")
+        return dict(defaults)
+
+
+def load_hardware_info(hardware_file: str) -> dict:
+    """Load hardware info from JSON file."""
+    return _load_info(hardware_file, DEFAULT_HARDWARE, "hardware")
 
 
 def load_timings_info(timings_file: str) -> dict:
     """Load timing info from JSON file."""
-    default_timings = {
-        "axon_download_ms": 0,
-        "core_download_ms": 0,
-        "core_startup_ms": 0
-    }
-    
-    if not timings_file or not os.path.exists(timings_file):
-        return default_timings
-    
-    try:
-        with open(timings_file) as f:
-            timings = json.load(f)
-            # Merge with defaults for any missing fields
-            for key, value in default_timings.items():
-                if key not in timings:
-                    timings[key] = value
-            return timings
-    except Exception as e:
-        print(f"Warning: Could not load timings info: {e}")
-        return default_timings
+    return _load_info(timings_file, DEFAULT_SETUP_TIMINGS, "timings")
 
 
 def load_resources_info(resources_file: str) -> dict:
     """Load resource usage info from JSON file."""
-    default_resources = {
-        "core_idle_cpu": 0,
-        "core_idle_mem_mb": 0,
-        "core_load_cpu_avg": 0,
-        "core_load_cpu_max": 0,
-        "core_load_mem_avg_mb": 0,
-        "core_load_mem_max_mb": 0,
-        "axon_cpu": 0,
-        "axon_mem_mb": 0,
-        "gpu_status": "Not used (CPU-only inference)"
-    }
-    
-    if not resources_file or not os.path.exists(resources_file):
-        return default_resources
+    return _load_info(resources_file, DEFAULT_RESOURCES, "resources")
+
+
+def write_bytes_atomic(output_file: str, payload: bytes) -> None:
+    """Write payload to output_file atomically.
     
+    The bytes go to a uniquely named temporary file next to the target,
+    which is flushed to disk and then renamed over it, so readers never see
+    a half-written file and concurrent writers don't clobber each other.
+    An existing target keeps its permissions; a new one gets the umask default.
+    """
     try:
-        with open(resources_file) as f:
-            resources = json.load(f)
-            # Merge with defaults for any missing fields
-            for key, value in default_resources.items():
-                if key not in resources:
-                    resources[key] = value
-            return resources
-    except Exception as e:
-        print(f"Warning: Could not load resources info: {e}")
-        return default_resources
+        mode = stat.S_IMODE(os.stat(output_file).st_mode)
+    except FileNotFoundError:
+        mode = 0o666 & ~UMASK
+
+    # mkstemp creates the file 0o600; it is widened with fchmod below
+    fd, tmp_file = tempfile.mkstemp(
+        dir=os.path.dirname(output_file) or '.',
+        prefix=f".{os.path.basename(output_file)}.",
+        suffix=".tmp",
+    )
+    try:
+        # The payload is already encoded, so write it straight to the descriptor;
+        # os.write may write less than asked, hence the loop
+        try:
+            view = memoryview(payload)
+            while view:
+                view = view[os.write(fd, view):]
+            os.fchmod(fd, mode)
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+        os.replace(tmp_file, output_file)
+    except BaseException:
+        if os.path.exists(tmp_file):
+            os.remove(tmp_file)
+        raise
+
+
+def write_json_atomic(output_file: str, data: dict) -> None:
+    """Write data as indented JSON (newline-terminated), replacing output_file atomically.
+    
+    orjson encodes straight to the bytes that are written, so there is no
+    intermediate str of the whole document.
+    """
+    if HAS_ORJSON:
+        payload = orjson.dumps(
+            data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE
+        )
+    else:
+        payload = (json.dumps(data, indent=2) + "\n").encode('utf-8')
+    write_bytes_atomic(output_file, payload)
 
 
 def main():
     parser = argparse.ArgumentParser(description="Aggregate parallel model test results")
-    parser.add_argument("--results-dir", required=True, help="Directory containing result JSON files")
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("--results-dir", help="Directory containing result JSON files")
+    source.add_argument("--results-ndjson", help="Single file with one result JSON object per line (streamed)")
     parser.add_argument("--output", default="aggregated-metrics.json", help="Output JSON file")
     parser.add_argument("--markdown", help="Optional markdown report output")
     parser.add_argument("--hardware-info", help="JSON file with hardware information")
     parser.add_argument("--timings-info", help="JSON file with setup timing information")
     parser.add_argument("--resources-info", help="JSON file with resource usage information")
     parser.add_argument("--github-summary", action="store_true", help="Write to GITHUB_STEP_SUMMARY")
+    parser.add_argument("--binary-output", help="Optional msgpack copy of the summary (requires msgpack)")
     
     args = parser.parse_args()
     
@@ -391,15 +616,21 @@ def main():
     resources = load_resources_info(args.resources_info)
     print(f"Resources: Core idle={resources.get('core_idle_cpu', 0)}% CPU, {resources.get('core_idle_mem_mb', 0)}MB RAM")
     
-    # Load results
-    print(f"Loading results from: {args.results_dir}")
-    results = load_result_files(args.results_dir)
+    # Load results (an NDJSON input is streamed through the aggregation)
+    if args.results_ndjson:
+        print(f"Streaming results from: {args.results_ndjson}")
+        results = stream_results_ndjson(args.results_ndjson)
+    else:
+        print(f"Loading results from: {args.results_dir}")
+        results = load_result_files(args.results_dir)
+    generated_at = utc_timestamp()
+    summary = aggregate_results(results, hardware, setup_timings, resources, generated_at)
     
-    if not results:
+    if not summary["total_models"]:
         print("No results found!")
         # Create empty summary
         summary = {
-            "generated_at": datetime.utcnow().isoformat() + "Z",
+            "generated_at": generated_at,
             "total_models": 0,
             "successful_models": 0,
             "partial_models": 0,
@@ -411,28 +642,40 @@ def main():
             "error": "No results found"
         }
     else:
-        print(f"Found {len(results)} model results")
-        summary = aggregate_results(results, hardware, setup_timings, resources)
+        print(f"Found {summary['total_models']} model results")
     
     # Write JSON output
-    with open(args.output, 'w') as f:
-        json.dump(summary, f, indent=2)
+    write_json_atomic(args.output, summary)
     print(f"Wrote aggregated metrics to: {args.output}")
     
-    # Generate markdown report
-    markdown = generate_markdown_report(summary)
-    
-    if args.markdown:
-        with open(args.markdown, 'w') as f:
-            f.write(markdown)
-        print(f"Wrote markdown report to: {args.markdown}")
-    
-    # Write to GitHub Actions summary
-    if args.github_summary:
-        summary_file = os.environ.get("GITHUB_STEP_SUMMARY")
+    # Binary copy for tooling that would otherwise re-parse the JSON; the JSON
+    # stays the canonical artifact, so a missing msgpack only skips this
+    if args.binary_output:
+        if HAS_MSGPACK:
+            write_bytes_atomic(args.binary_output, msgpack.packb(summary, use_bin_type=True))
+            print(f"Wrote binary metrics to: {args.binary_output}")
+        else:
+            print("Warning: msgpack is not installed, skipping --binary-output")
+    
+    # Generate markdown report (only if something consumes it)
+    summary_file = os.environ.get("GITHUB_STEP_SUMMARY") if args.github_summary else None
+    if args.markdown or summary_file:
+        # Both outputs are written in binary mode from UTF-8 chunks; a single
+        # output streams the report, both share one encoded copy
+        if args.markdown and summary_file:
+            markdown_chunks = [generate_markdown_report(summary).encode('utf-8')]
+        else:
+            markdown_chunks = (chunk.encode('utf-8') for chunk in iter_markdown_report(summary))
+        
+        if args.markdown:
+            with open(args.markdown, 'wb') as f:
+                f.writelines(markdown_chunks)
+            print(f"Wrote markdown report to: {args.markdown}")
+        
+        # Write to GitHub Actions summary
         if summary_file:
-            with open(summary_file, 'a') as f:
-                f.write(markdown)
+            with open(summary_file, 'ab') as f:
+                f.writelines(markdown_chunks)
             print("Wrote to GITHUB_STEP_SUMMARY")
     
     # Exit with error if all tests failed
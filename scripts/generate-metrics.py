@@ -13,6 +13,62 @@ from datetime import datetime, timezone
 from pathlib import Path
 
 
+# Read buffer for test.log; CI logs run to many MB, well past the 8 KiB default
+LOG_READ_BUFFER = 1 << 20
+
+# Log patterns, compiled once at import rather than on every parse
+ANSI_ESCAPE_RE = re.compile(r'\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])')
+AXON_DOWNLOAD_RE = re.compile(r'Axon download[:\s]+(\d+)\s*ms', re.IGNORECASE)
+CORE_DOWNLOAD_RE = re.compile(r'Core download[:\s]+(\d+)\s*ms', re.IGNORECASE)
+CORE_STARTUP_RE = re.compile(r'Core (?:startup|ready)[:\s]+\(?(\d+)\s*ms', re.IGNORECASE)
+TEST_DURATION_RE = re.compile(r'Test completed in (\d+)s')
+CORE_IDLE_RE = re.compile(r'Core idle: CPU=([0-9.]+)%, Memory=([0-9.]+)MB')
+CORE_LOAD_RE = re.compile(r'Core load: CPU=([0-9.]+)% \(max:([0-9.]+)%\), Memory=([0-9.]+)MB \(max:([0-9.]+)MB\)')
+# "✅ Installed gpt2 (1ms)", "✅ Registered gpt2 (1ms)", "✅ gpt2 inference
+# successful (1ms)" and "✅ gpt2 large inference successful (1ms)" in one scan;
+# the named group that matched says which kind of line it was
+MODEL_TIMING_RE = re.compile(
+    r'✅\s*(?:Installed\s+(?P<install>\w+)'
+    r'|Registered\s+(?P<register>\w+)'
+    r'|(?P<large>\w+)\s+large\s+inference\s+successful'
+    r'|(?P<inference>\w+)\s+inference\s+successful)'
+    r'\s+\((?P<ms>\d+)ms\)',
+    re.IGNORECASE,
+)
+# The model name may only start right after the marker or at a word boundary,
+# so the lazy gap never retries \w+ from inside a word (quadratic on long lines)
+FAILED_INFERENCE_RE = re.compile(r'(?:❌|ERROR)(?:.*?(?<!\w))??(\w+)\s+inference\s+failed', re.IGNORECASE)
+# Single-marker variants start with a plain literal, which the regex engine
+# can skip to directly; used when a line only contains one of the markers
+FAILED_EMOJI_RE = re.compile(r'❌(?:.*?(?<!\w))??(\w+)\s+inference\s+failed', re.IGNORECASE)
+FAILED_ERROR_RE = re.compile(r'ERROR(?:.*?(?<!\w))??(\w+)\s+inference\s+failed', re.IGNORECASE)
+COMPLETED_COUNT_RE = re.compile(r'Completed\s+(\d+)/(\d+)\s+inference\s+tests')
+# Patterns read from their first matching line, each with a lower-cased
+# literal it requires
+FIRST_MATCH_PATTERNS = (
+    ('axon download', AXON_DOWNLOAD_RE),
+    ('core download', CORE_DOWNLOAD_RE),
+    ('core ', CORE_STARTUP_RE),
+    ('test completed in', TEST_DURATION_RE),
+    ('core idle:', CORE_IDLE_RE),
+    ('core load:', CORE_LOAD_RE),
+    ('completed', COMPLETED_COUNT_RE),
+)
+
+
+def _read_disk_space(hw):
+    """Fill in total/available disk space for / from `df -h`."""
+    try:
+        df_output = subprocess.check_output(["df", "-h", "/"], text=True)
+        lines = df_output.strip().split("\n")
+        if len(lines) >= 2:
+            parts = lines[1].split()
+            hw["disk_total"] = parts[1]
+            hw["disk_available"] = parts[3]
+    except Exception:
+        pass
+
+
 def detect_hardware():
     """Detect actual hardware specifications."""
     hw = {
@@ -58,36 +114,37 @@ def detect_hardware():
                 if platform.machine() == "arm64":
                     hw["cpu_model"] = "Apple Silicon"
         
-        # Memory
+        # Memory and CPU cores/threads; sysctl prints one value per key
         try:
-            mem_bytes = int(subprocess.check_output(
-                ["sysctl", "-n", "hw.memsize"], text=True
-            ).strip())
+            mem_bytes, cores, threads = map(int, subprocess.check_output(
+                ["sysctl", "-n", "hw.memsize", "hw.physicalcpu", "hw.logicalcpu"], text=True
+            ).split())
             hw["memory_gb"] = round(mem_bytes / (1024**3))
+            hw["cpu_cores"] = cores
+            hw["cpu_threads"] = threads
         except Exception:
-            pass
-        
-        # CPU cores/threads
-        try:
-            hw["cpu_cores"] = int(subprocess.check_output(
-                ["sysctl", "-n", "hw.physicalcpu"], text=True
-            ).strip())
-            hw["cpu_threads"] = int(subprocess.check_output(
-                ["sysctl", "-n", "hw.logicalcpu"], text=True
-            ).strip())
-        except Exception:
-            pass
+            # One unknown key fails the whole call, so fall back to asking
+            # for each value separately
+            try:
+                mem_bytes = int(subprocess.check_output(
+                    ["sysctl", "-n", "hw.memsize"], text=True
+                ).strip())
+                hw["memory_gb"] = round(mem_bytes / (1024**3))
+            except Exception:
+                pass
+            
+            try:
+                hw["cpu_cores"] = int(subprocess.check_output(
+                    ["sysctl", "-n", "hw.physicalcpu"], text=True
+                ).strip())
+                hw["cpu_threads"] = int(subprocess.check_output(
+                    ["sysctl", "-n", "hw.logicalcpu"], text=True
+                ).strip())
+            except Exception:
+                pass
         
         # Disk space
-        try:
-            df_output = subprocess.check_output(["df", "-h", "/"], text=True)
-            lines = df_output.strip().split("\n")
-            if len(lines) >= 2:
-                parts = lines[1].split()
-                hw["disk_total"] = parts[1]
-                hw["disk_available"] = parts[3]
-        except Exception:
-            pass
+        _read_disk_space(hw)
     
     elif system == "Linux":
         # Linux
@@ -103,17 +160,18 @@ def detect_hardware():
         
         # CPU model
         try:
-            with open("/proc/cpuinfo") as f:
+            # procfs files report no size, so read them in small fixed chunks
+            with open("/proc/cpuinfo", buffering=4096) as f:
                 for line in f:
-                    if "model name" in line:
-                        hw["cpu_model"] = line.split(":")[1].strip()
+                    if line.startswith("model name"):
+                        hw["cpu_model"] = line.split(":", 1)[1].strip()
                         break
         except Exception:
             pass
         
         # Memory
         try:
-            with open("/proc/meminfo") as f:
+            with open("/proc/meminfo", buffering=4096) as f:
                 for line in f:
                     if line.startswith("MemTotal:"):
                         mem_kb = int(line.split()[1])
@@ -123,15 +181,7 @@ def detect_hardware():
             pass
         
         # Disk space
-        try:
-            df_output = subprocess.check_output(["df", "-h", "/"], text=True)
-            lines = df_output.strip().split("\n")
-            if len(lines) >= 2:
-                parts = lines[1].split()
-                hw["disk_total"] = parts[1]
-                hw["disk_available"] = parts[3]
-        except Exception:
-            pass
+        _read_disk_space(hw)
     
     else:
         # Windows or other
@@ -170,41 +220,78 @@ def parse_test_log(log_file):
         print(f"⚠️ Log file not found: {log_file}")
         return metrics
     
-    with open(log_file, 'r', encoding='utf-8', errors='ignore') as f:
-        content = f.read()
-    
-    # Strip ANSI color codes
-    ansi_escape = re.compile(r'\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])')
-    content = ansi_escape.sub('', content)
+    # Stream the log one line at a time; every pattern matches within a
+    # single line, so nothing needs the whole file in memory at once
+    first_matches = {}
+    pending = list(FIRST_MATCH_PATTERNS)
+    timings = {'install': [], 'register': [], 'inference': [], 'large': []}
+    failed_models = []
+    with open(log_file, 'r', encoding='utf-8', errors='ignore', buffering=LOG_READ_BUFFER) as f:
+        for line in f:
+            # Strip ANSI color codes
+            if '\x1b' in line:
+                line = ANSI_ESCAPE_RE.sub('', line)
+            # Cheap substring checks gate each regex so lines without the
+            # literal a pattern needs are never scanned
+            lowered = line.lower()
+            
+            # Timings and resource usage come from the first matching line;
+            # a pattern stops being checked once it has been found
+            for entry in tuple(pending):
+                literal, pattern = entry
+                if literal in lowered:
+                    match = pattern.search(line)
+                    if match:
+                        first_matches[pattern] = match
+                        pending.remove(entry)
+            
+            # Collect install/register/inference timings; they are applied
+            # kind by kind below so models are added in a stable order
+            if '✅' in line:
+                for match in MODEL_TIMING_RE.finditer(line):
+                    for kind, entries in timings.items():
+                        if match.group(kind) is not None:
+                            entries.append((match.group(kind).lower(), int(match.group('ms'))))
+                            break
+            
+            if 'failed' in lowered:
+                if 'error' not in lowered:
+                    failed_pattern = FAILED_EMOJI_RE
+                elif '❌' not in line:
+                    failed_pattern = FAILED_ERROR_RE
+                else:
+                    failed_pattern = FAILED_INFERENCE_RE
+                for match in failed_pattern.finditer(line):
+                    failed_models.append(match.group(1).lower())
     
     # Extract Axon download time
-    match = re.search(r'Axon download[:\s]+(\d+)\s*ms', content, re.IGNORECASE)
+    match = first_matches.get(AXON_DOWNLOAD_RE)
     if match:
         metrics['timings']['axon_download_ms'] = int(match.group(1))
     
     # Extract Core download time
-    match = re.search(r'Core download[:\s]+(\d+)\s*ms', content, re.IGNORECASE)
+    match = first_matches.get(CORE_DOWNLOAD_RE)
     if match:
         metrics['timings']['core_download_ms'] = int(match.group(1))
     
     # Extract Core startup time
-    match = re.search(r'Core (?:startup|ready)[:\s]+\(?(\d+)\s*ms', content, re.IGNORECASE)
+    match = first_matches.get(CORE_STARTUP_RE)
     if match:
         metrics['timings']['core_startup_ms'] = int(match.group(1))
     
     # Extract total duration
-    match = re.search(r'Test completed in (\d+)s', content)
+    match = first_matches.get(TEST_DURATION_RE)
     if match:
         metrics['timings']['total_duration_s'] = int(match.group(1))
     
     # Extract resource usage - idle: "📊 Core idle: CPU=X%, Memory=XMB"
-    match = re.search(r'Core idle: CPU=([0-9.]+)%, Memory=([0-9.]+)MB', content)
+    match = first_matches.get(CORE_IDLE_RE)
     if match:
         metrics['core_idle_cpu'] = float(match.group(1))
         metrics['core_idle_mem_mb'] = float(match.group(2))
     
     # Extract resource usage - load: "📊 Core load: CPU=X% (max:X%), Memory=XMB (max:XMB)"
-    match = re.search(r'Core load: CPU=([0-9.]+)% \(max:([0-9.]+)%\), Memory=([0-9.]+)MB \(max:([0-9.]+)MB\)', content)
+    match = first_matches.get(CORE_LOAD_RE)
     if match:
         metrics['core_load_cpu_avg'] = float(match.group(1))
         metrics['core_load_cpu_max'] = float(match.group(2))
@@ -212,11 +299,8 @@ def parse_test_log(log_file):
         metrics['core_load_mem_max'] = float(match.group(4))
     
     # Extract model install times: "✅ Installed gpt2 (299417ms)"
-    install_pattern = re.compile(r'✅\s*Installed\s+(\w+)\s+\((\d+)ms\)', re.IGNORECASE)
     total_install_time = 0
-    for match in install_pattern.finditer(content):
-        model_name = match.group(1).lower()
-        install_time = int(match.group(2))
+    for model_name, install_time in timings['install']:
         total_install_time += install_time
         if model_name not in metrics['models']:
             metrics['models'][model_name] = {'category': 'nlp'}
@@ -224,11 +308,8 @@ def parse_test_log(log_file):
     metrics['timings']['total_model_install_ms'] = total_install_time
     
     # Extract register times: "✅ Registered gpt2 (564ms)"
-    register_pattern = re.compile(r'✅\s*Registered\s+(\w+)\s+\((\d+)ms\)', re.IGNORECASE)
     total_register_time = 0
-    for match in register_pattern.finditer(content):
-        model_name = match.group(1).lower()
-        register_time = int(match.group(2))
+    for model_name, register_time in timings['register']:
         total_register_time += register_time
         if model_name not in metrics['models']:
             metrics['models'][model_name] = {'category': 'nlp'}
@@ -236,11 +317,8 @@ def parse_test_log(log_file):
     metrics['timings']['total_register_ms'] = total_register_time
     
     # Extract inference times: "✅ gpt2 inference successful (89ms)"
-    inference_pattern = re.compile(r'✅\s*(\w+)\s+inference\s+successful\s+\((\d+)ms\)', re.IGNORECASE)
     total_inference_time = 0
-    for match in inference_pattern.finditer(content):
-        model_name = match.group(1).lower()
-        inference_time = int(match.group(2))
+    for model_name, inference_time in timings['inference']:
         total_inference_time += inference_time
         if model_name not in metrics['models']:
             metrics['models'][model_name] = {'category': 'nlp'}
@@ -250,10 +328,7 @@ def parse_test_log(log_file):
     metrics['timings']['total_inference_ms'] = total_inference_time
     
     # Extract large inference times: "✅ gpt2 large inference successful (169ms)"
-    large_inference_pattern = re.compile(r'✅\s*(\w+)\s+large\s+inference\s+successful\s+\((\d+)ms\)', re.IGNORECASE)
-    for match in large_inference_pattern.finditer(content):
-        model_name = match.group(1).lower()
-        inference_time = int(match.group(2))
+    for model_name, inference_time in timings['large']:
         if model_name not in metrics['models']:
             metrics['models'][model_name] = {'category': 'nlp'}
         metrics['models'][model_name]['inference_large_time_ms'] = inference_time
@@ -261,16 +336,14 @@ def parse_test_log(log_file):
         metrics['models'][model_name]['inference_large_tested'] = True
     
     # Extract failed inferences: "❌ resnet inference failed"
-    failed_pattern = re.compile(r'(?:❌|ERROR).*?(\w+)\s+inference\s+failed', re.IGNORECASE)
-    for match in failed_pattern.finditer(content):
-        model_name = match.group(1).lower()
+    for model_name in failed_models:
         if model_name not in metrics['models']:
             metrics['models'][model_name] = {'category': 'vision'}
         metrics['models'][model_name]['inference_status'] = 'failed'
         metrics['models'][model_name]['tested'] = True
     
     # Extract total inference count: "Completed 6/7 inference tests"
-    match = re.search(r'Completed\s+(\d+)/(\d+)\s+inference\s+tests', content)
+    match = first_matches.get(COMPLETED_COUNT_RE)
     if match:
         metrics['successful_inferences'] = int(match.group(1))
         metrics['total_inferences'] = int(match.group(2))
@@ -22,11 +22,16 @@ Usage:
 import argparse
 import json
 import statistics
+import time
 from pathlib import Path
-from datetime import datetime
 from typing import Dict, List, Any, Optional
 
 
+def utc_timestamp() -> str:
+    """Current UTC time as an ISO 8601 string with a Z suffix (second precision)."""
+    return time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
+
+
 def load_json(path: Path) -> Dict:
     """Load JSON file, return empty dict if not found."""
     if path.exists():
@@ -45,7 +50,7 @@ def save_json(path: Path, data: Dict):
 def extract_run_metrics(metrics: Dict) -> Dict:
     """Extract key metrics from a single run for historical tracking."""
     run_data = {
-        'timestamp': metrics.get('generated_at', datetime.utcnow().isoformat() + 'Z'),
+        'timestamp': metrics.get('generated_at') or utc_timestamp(),
         'versions': metrics.get('versions', {}),
         'total_models': metrics.get('total_models', 0),
         'successful_models': metrics.get('successful_models', 0),
@@ -84,15 +89,16 @@ def add_run(metrics_path: Path, history_path: Path) -> Dict:
     metrics = load_json(metrics_path)
     history = load_json(history_path)
 
+    now = utc_timestamp()
     if 'runs' not in history:
         history['runs'] = []
-        history['created_at'] = datetime.utcnow().isoformat() + 'Z'
+        history['created_at'] = now
 
     run_data = extract_run_metrics(metrics)
     run_data['run_number'] = len(history['runs']) + 1
 
     history['runs'].append(run_data)
-    history['updated_at'] = datetime.utcnow().isoformat() + 'Z'
+    history['updated_at'] = now
     history['total_runs'] = len(history['runs'])
 
     save_json(history_path, history)
@@ -111,7 +117,7 @@ def calculate_statistics(history: Dict) -> Dict:
         return {'error': 'No runs in history'}
 
     stats = {
-        'generated_at': datetime.utcnow().isoformat() + 'Z',
+        'generated_at': utc_timestamp(),
         'total_runs': len(runs),
         'first_run': runs[0].get('timestamp') if runs else None,
         'last_run': runs[-1].get('timestamp') if runs else None,
@@ -200,12 +206,13 @@ def calc_stats(values: List[float]) -> Dict[str, float]:
 
 def reset_history(history_path: Path) -> Dict:
     """Reset the historical data."""
+    now = utc_timestamp()
     history = {
         'runs': [],
-        'created_at': datetime.utcnow().isoformat() + 'Z',
-        'updated_at': datetime.utcnow().isoformat() + 'Z',
+        'created_at': now,
+        'updated_at': now,
         'total_runs': 0,
-        'reset_at': datetime.utcnow().isoformat() + 'Z'
+        'reset_at': now
     }
     save_json(history_path, history)
     print(f"History reset at {history_path}")
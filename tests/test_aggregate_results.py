@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+"""
+Tests for scripts/aggregate-results.py.
+
+Usage:
+    python3 -m unittest discover -s tests
+"""
+
+import contextlib
+import importlib.util
+import io
+import json
+import os
+import stat
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+SCRIPT = Path(__file__).resolve().parent.parent / "scripts" / "aggregate-results.py"
+
+
+def load_script():
+    """Import aggregate-results.py (its hyphenated name can't be imported directly)."""
+    spec = importlib.util.spec_from_file_location("aggregate_results", SCRIPT)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+aggregate = load_script()
+
+
+def result(model_name, status="success"):
+    """A minimal per-model result as written by the test pipelines."""
+    return {
+        "model_name": model_name,
+        "status": status,
+        "phases": {
+            "install": {"status": "success", "time_ms": 10},
+            "inference_small": {"status": status, "time_ms": 5},
+        },
+        "total_time_ms": 20,
+    }
+
+
+def run_main(*argv):
+    """Run main() with argv; returns (exit code, stdout, stderr)."""
+    stdout, stderr = io.StringIO(), io.StringIO()
+    with mock.patch.object(sys, "argv", ["aggregate-results.py", *argv]), \
+            contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+        try:
+            aggregate.main()
+        except SystemExit as e:
+            return e.code, stdout.getvalue(), stderr.getvalue()
+    return 0, stdout.getvalue(), stderr.getvalue()
+
+
+class StreamResultsNdjsonTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = Path(self.tmp.name) / "results.ndjson"
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def stream(self, lines, has_orjson):
+        self.path.write_bytes(b"\n".join(lines) + b"\n")
+        output = io.StringIO()
+        with mock.patch.object(aggregate, "HAS_ORJSON", has_orjson), contextlib.redirect_stdout(output):
+            results = list(aggregate.stream_results_ndjson(str(self.path)))
+        return results, output.getvalue()
+
+    def check_bad_lines_are_skipped(self, has_orjson):
+        lines = [
+            json.dumps(result("gpt2")).encode(),
+            b"",
+            b'{"model_name": "bert", ',        # truncated JSON
+            b'{"x":"\xc3\x28"}',              # invalid UTF-8
+            b'["not", "an", "object"]',
+            json.dumps({**result("resnet"), "extra": [1, 2, 3]}).encode(),
+        ]
+        results, output = self.stream(lines, has_orjson)
+        self.assertEqual([r["model_name"] for r in results], ["gpt2", "resnet"])
+        self.assertEqual(results[0]["_source_file"], f"{self.path}:1")
+        self.assertNotIn("extra", results[1])
+        self.assertIn(f"{self.path}:3", output)
+        self.assertIn(f"{self.path}:4", output)
+        self.assertIn(f"Error reading {self.path}:5: expected a JSON object", output)
+
+    def test_bad_lines_are_skipped_with_json(self):
+        self.check_bad_lines_are_skipped(has_orjson=False)
+
+    @unittest.skipUnless(aggregate.HAS_ORJSON, "orjson not installed")
+    def test_bad_lines_are_skipped_with_orjson(self):
+        self.check_bad_lines_are_skipped(has_orjson=True)
+
+    def test_missing_file_yields_nothing(self):
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            results = list(aggregate.stream_results_ndjson(str(self.path)))
+        self.assertEqual(results, [])
+        self.assertIn("Results file not found", output.getvalue())
+
+
+class LoadJsonFileTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = Path(self.tmp.name) / "result.json"
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    @unittest.skipUnless(aggregate.HAS_ORJSON, "orjson not installed")
+    def test_file_above_threshold_is_parsed_from_mmap(self):
+        data = {"model_name": "gpt2", "padding": "x" * (aggregate.MMAP_THRESHOLD + 1)}
+        self.path.write_text(json.dumps(data))
+        with mock.patch.object(aggregate.mmap, "mmap", wraps=aggregate.mmap.mmap) as mapped:
+            self.assertEqual(aggregate.load_json_file(self.path), data)
+        mapped.assert_called_once()
+
+    def test_empty_file_is_rejected(self):
+        self.path.write_bytes(b"")
+        with self.assertRaises(json.JSONDecodeError):
+            aggregate.load_json_file(self.path)
+
+
+class MainTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.dir = Path(self.tmp.name)
+        self.output = self.dir / "metrics.json"
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_results_dir_and_ndjson_are_mutually_exclusive(self):
+        code, _, stderr = run_main("--results-dir", str(self.dir), "--results-ndjson", str(self.dir / "r.ndjson"))
+        self.assertEqual(code, 2)
+        self.assertIn("not allowed with argument", stderr)
+
+    def test_a_results_source_is_required(self):
+        code, _, stderr = run_main("--output", str(self.output))
+        self.assertEqual(code, 2)
+        self.assertIn("one of the arguments --results-dir --results-ndjson is required", stderr)
+
+    def test_ndjson_input_is_aggregated(self):
+        ndjson = self.dir / "results.ndjson"
+        ndjson.write_text("\n".join(json.dumps(r) for r in (result("gpt2"), result("resnet", "failed"))) + "\n")
+        code, _, _ = run_main("--results-ndjson", str(ndjson), "--output", str(self.output))
+        self.assertEqual(code, 0)
+        summary = json.loads(self.output.read_text())
+        self.assertEqual(summary["total_models"], 2)
+        self.assertEqual(summary["successful_models"], 1)
+        self.assertEqual(summary["models"]["resnet"]["category"], "vision")
+
+    def test_binary_output_is_skipped_without_msgpack(self):
+        binary = self.dir / "metrics.msgpack"
+        (self.dir / "gpt2.json").write_text(json.dumps(result("gpt2")))
+        with mock.patch.object(aggregate, "HAS_MSGPACK", False):
+            code, stdout, _ = run_main("--results-dir", str(self.dir), "--output", str(self.output),
+                                       "--binary-output", str(binary))
+        self.assertEqual(code, 0)
+        self.assertTrue(self.output.exists())
+        self.assertFalse(binary.exists())
+        self.assertIn("msgpack is not installed", stdout)
+
+    @unittest.skipUnless(aggregate.HAS_MSGPACK, "msgpack not installed")
+    def test_binary_output_matches_json(self):
+        binary = self.dir / "metrics.msgpack"
+        (self.dir / "gpt2.json").write_text(json.dumps(result("gpt2")))
+        code, _, _ = run_main("--results-dir", str(self.dir), "--output", str(self.output),
+                              "--binary-output", str(binary))
+        self.assertEqual(code, 0)
+        self.assertEqual(aggregate.msgpack.unpackb(binary.read_bytes()), json.loads(self.output.read_text()))
+
+
+class WriteBytesAtomicTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.dir = Path(self.tmp.name)
+        self.output = self.dir / "metrics.json"
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_new_file_gets_umask_default_mode(self):
+        aggregate.write_bytes_atomic(str(self.output), b"{}\n")
+        self.assertEqual(self.output.read_bytes(), b"{}\n")
+        self.assertEqual(stat.S_IMODE(self.output.stat().st_mode), 0o666 & ~aggregate.UMASK)
+
+    def test_existing_file_keeps_its_mode(self):
+        self.output.write_bytes(b"old")
+        os.chmod(self.output, 0o640)
+        aggregate.write_bytes_atomic(str(self.output), b"new")
+        self.assertEqual(self.output.read_bytes(), b"new")
+        self.assertEqual(stat.S_IMODE(self.output.stat().st_mode), 0o640)
+
+    def test_failed_write_leaves_target_and_no_temp_file(self):
+        self.output.write_bytes(b"old")
+        with mock.patch.object(aggregate.os, "fsync", side_effect=OSError("disk full")):
+            with self.assertRaises(OSError):
+                aggregate.write_bytes_atomic(str(self.output), b"new")
+        self.assertEqual(self.output.read_bytes(), b"old")
+        self.assertEqual(os.listdir(self.dir), ["metrics.json"])
+
+
+if __name__ == "__main__":
+    unittest.main()